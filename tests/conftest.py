@@ -0,0 +1,42 @@
+"""Shared test configuration."""
+
+import os
+
+# Set before wry/pydantic are imported by any test module, so plugin
+# discovery is skipped when the first model class is created
+os.environ.setdefault("PYDANTIC_DISABLE_PLUGINS", "__all__")
+
+from collections.abc import Callable, Sequence  # noqa: E402
+
+import click  # noqa: E402
+import pytest  # noqa: E402
+from click.testing import CliRunner  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Click test runner shared by all tests - invoke() isolates each call."""
+    return CliRunner()
+
+
+def _exit_code(cmd: click.Command, args: Sequence[str]) -> int:
+    try:
+        with cmd.make_context(cmd.name or "cmd", list(args)) as ctx:
+            cmd.invoke(ctx)
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except click.ClickException as e:
+        return e.exit_code
+    except Exception:
+        # Same as CliRunner: any other exception (e.g. a ValidationError) exits with 1
+        return 1
+    return 0
+
+
+@pytest.fixture(scope="session")
+def invoke_exit_code() -> Callable[[click.Command, Sequence[str]], int]:
+    """Invoke a command without capturing output and return its exit code.
+
+    For tests that assert only on the exit code - it skips CliRunner's stream isolation.
+    """
+    return _exit_code
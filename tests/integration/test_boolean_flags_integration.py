@@ -1,85 +1,27 @@
 """Integration tests for boolean on/off flags."""
 
-import os
-import tempfile
+import re
 from typing import Annotated, Any, ClassVar
 
 import click
-from click.testing import CliRunner
+import pytest
 from pydantic import Field
 
 from wry import AutoOption, AutoWryModel
 
 
+@pytest.mark.xdist_group(name="wry_click_boolean_flags")
 class TestBooleanFlagsIntegration:
     """End-to-end tests for boolean on/off flags."""
 
-    def test_cli_precedence_over_json(self):
-        """Test that CLI flags override JSON config."""
-
-        class Config(AutoWryModel):
-            debug: bool = Field(default=False, description="Debug mode")
-            verbose: bool = Field(default=False, description="Verbose output")
-
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Debug: {config.debug} (source: {config.source.debug.value})")
-            click.echo(f"Verbose: {config.verbose} (source: {config.source.verbose.value})")
-
-        runner = CliRunner()
-
-        # Create JSON config with values
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write('{"debug": true, "verbose": true}')
-            json_file = f.name
-
-        try:
-            # CLI should override JSON
-            result = runner.invoke(cmd, ["--config", json_file, "--no-debug", "--no-verbose"])
-            assert result.exit_code == 0
-            assert "Debug: False (source: cli)" in result.output
-            assert "Verbose: False (source: cli)" in result.output
-        finally:
-            os.unlink(json_file)
-
-    def test_environment_variables_with_on_off_flags(self):
-        """Test that environment variables work with on/off flags."""
-
-        class Config(AutoWryModel):
-            wry_env_prefix: ClassVar[str] = "TEST_"
-            debug: bool = Field(default=False, description="Debug mode")
-
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Debug: {config.debug}")
-            click.echo(f"Source: {config.source.debug.value}")
-
-        runner = CliRunner()
-
-        # Test with env var
-        result = runner.invoke(cmd, [], env={"TEST_DEBUG": "true"})
-        assert result.exit_code == 0
-        assert "Debug: True" in result.output
-        assert "Source: env" in result.output
-
-        # CLI should override env
-        result = runner.invoke(cmd, ["--no-debug"], env={"TEST_DEBUG": "true"})
-        assert result.exit_code == 0
-        assert "Debug: False" in result.output
-        assert "Source: cli" in result.output
-
-    def test_all_sources_with_boolean(self):
-        """Test DEFAULT < ENV < JSON < CLI precedence for boolean fields."""
+    @pytest.fixture(scope="class")
+    def sources_cmd(self):
+        """Command for a model whose booleans can come from DEFAULT/ENV/JSON/CLI."""
 
         class Config(AutoWryModel):
             wry_env_prefix: ClassVar[str] = "TEST_"
             debug: bool = Field(default=False, description="Debug mode")
+            verbose: bool = Field(default=False, description="Verbose output")
             trace: bool = Field(default=False, description="Trace")
             log: bool = Field(default=False, description="Log")
 
@@ -88,32 +30,16 @@ class TestBooleanFlagsIntegration:
         @click.pass_context
         def cmd(ctx: click.Context, **kwargs: Any):
             config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Debug: {config.debug} ({config.source.debug.value})")
-            click.echo(f"Trace: {config.trace} ({config.source.trace.value})")
-            click.echo(f"Log: {config.log} ({config.source.log.value})")
-
-        runner = CliRunner()
+            click.echo(f"Debug: {config.debug} (source: {config.source.debug.value})")
+            click.echo(f"Verbose: {config.verbose} (source: {config.source.verbose.value})")
+            click.echo(f"Trace: {config.trace} (source: {config.source.trace.value})")
+            click.echo(f"Log: {config.log} (source: {config.source.log.value})")
 
-        # Create JSON config
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write('{"trace": true}')  # Only trace in JSON
-            json_file = f.name
+        return cmd
 
-        try:
-            # Test precedence:
-            # - debug: DEFAULT (false) - not in JSON, ENV, or CLI
-            # - trace: JSON (true) - JSON wins (no ENV or CLI override)
-            # - log: CLI (true) - CLI wins over all
-            result = runner.invoke(cmd, ["--config", json_file, "--log"])
-            assert result.exit_code == 0
-            assert "Debug: False (default)" in result.output  # Uses default from model
-            assert "Trace: True (json)" in result.output  # JSON wins
-            assert "Log: True (cli)" in result.output  # CLI wins
-        finally:
-            os.unlink(json_file)
-
-    def test_mixed_on_off_and_single_flags(self):
-        """Test mixing on/off flags and single flags in same model."""
+    @pytest.fixture(scope="class")
+    def mixed_flags_cmd(self):
+        """Command mixing on/off and single-flag booleans."""
 
         class Config(AutoWryModel):
             on_off_flag: bool = Field(default=False, description="Uses on/off pattern")
@@ -127,22 +53,11 @@ class TestBooleanFlagsIntegration:
             config = Config(**kwargs)
             click.echo(f"OnOff: {config.on_off_flag}, Single: {config.single_flag}")
 
-        runner = CliRunner()
-        result = runner.invoke(cmd, ["--help"])
-
-        # Check patterns
-        assert "--on-off-flag" in result.output
-        assert "--no-on-off-flag" in result.output
-        assert "--single-flag" in result.output
-        # Single flag shouldn't have no-option
-        help_lines = result.output.split("\n")
-        single_flag_line = [line for line in help_lines if "--single-flag" in line]
-        if single_flag_line:
-            # Make sure there's no --no-single-flag on the same line
-            assert "--no-single-flag" not in single_flag_line[0]
-
-    def test_custom_off_option_overrides_model_prefix(self):
-        """Test that per-field flag_off_option overrides model-wide prefix."""
+        return cmd
+
+    @pytest.fixture(scope="class")
+    def custom_off_cmd(self):
+        """Command combining a model-wide off-prefix with a per-field off-option."""
 
         class Config(AutoWryModel):
             wry_boolean_off_prefix: ClassVar[str] = "disable"
@@ -158,15 +73,78 @@ class TestBooleanFlagsIntegration:
         def cmd(**kwargs: Any):
             pass
 
-        runner = CliRunner()
-        result = runner.invoke(cmd, ["--help"])
-
-        # debug uses model-wide prefix
-        assert "--debug" in result.output
-        assert "--disable-debug" in result.output
-
-        # verbose uses custom off-option
-        assert "--verbose" in result.output
-        assert "--quiet" in result.output
-        assert "--no-verbose" not in result.output  # Shouldn't use default
-        assert "--disable-verbose" not in result.output  # Shouldn't use model-wide
+        return cmd
+
+    @pytest.mark.parametrize(
+        "args,env,json_body,expects",
+        [
+            pytest.param(
+                ["--no-debug", "--no-verbose"],
+                {},
+                '{"debug": true, "verbose": true}',
+                ["Debug: False (source: cli)", "Verbose: False (source: cli)"],
+                id="cli-over-json",
+            ),
+            pytest.param([], {"TEST_DEBUG": "true"}, None, ["Debug: True (source: env)"], id="env"),
+            pytest.param(
+                ["--no-debug"], {"TEST_DEBUG": "true"}, None, ["Debug: False (source: cli)"], id="cli-over-env"
+            ),
+            # - debug: DEFAULT (false) - not in JSON, ENV, or CLI
+            # - trace: JSON (true) - JSON wins (no ENV or CLI override)
+            # - log: CLI (true) - CLI wins over all
+            pytest.param(
+                ["--log"],
+                {},
+                '{"trace": true}',
+                ["Debug: False (source: default)", "Trace: True (source: json)", "Log: True (source: cli)"],
+                id="all-sources",
+            ),
+        ],
+    )
+    def test_boolean_source_precedence(self, runner, sources_cmd, args, env, json_body, expects):
+        """Test DEFAULT < ENV < JSON < CLI precedence for boolean fields."""
+        # JSON is fed through stdin (--config -), so no file is written
+        if json_body is not None:
+            args = ["--config", "-", *args]
+        result = runner.invoke(sources_cmd, args, input=json_body, env=env)
+
+        assert result.exit_code == 0, result.output
+        missing = [s for s in expects if s not in result.output]
+        assert not missing, missing
+
+    @pytest.fixture(scope="class")
+    def mixed_flags_help(self, runner, mixed_flags_cmd):
+        """Rendered --help output for mixed_flags_cmd, generated once per class."""
+        return runner.invoke(mixed_flags_cmd, ["--help"]).output
+
+    @pytest.fixture(scope="class")
+    def custom_off_help(self, runner, custom_off_cmd):
+        """Rendered --help output for custom_off_cmd, generated once per class."""
+        return runner.invoke(custom_off_cmd, ["--help"]).output
+
+    @pytest.mark.parametrize("needle", ["--on-off-flag", "--no-on-off-flag", "--single-flag"])
+    def test_mixed_on_off_and_single_flags(self, mixed_flags_help, needle):
+        """Test mixing on/off flags and single flags in same model."""
+        assert needle in mixed_flags_help
+
+    def test_single_flag_has_no_off_option(self, mixed_flags_help):
+        """Test that an opted-out single flag gets no --no-option."""
+        match = re.search(r"^.*--single-flag.*$", mixed_flags_help, re.M)
+        assert match and "--no-single-flag" not in match.group(0)
+
+    @pytest.mark.parametrize(
+        "needle,present",
+        [
+            # debug uses model-wide prefix
+            ("--debug", True),
+            ("--disable-debug", True),
+            # verbose uses custom off-option
+            ("--verbose", True),
+            ("--quiet", True),
+            ("--no-verbose", False),  # Shouldn't use default
+            ("--disable-verbose", False),  # Shouldn't use model-wide
+        ],
+    )
+    def test_custom_off_option_overrides_model_prefix(self, custom_off_help, needle, present):
+        """Test that per-field flag_off_option overrides model-wide prefix."""
+        assert (needle in custom_off_help) is present
@@ -3,33 +3,40 @@
 from typing import Annotated, Any
 
 import click
-from click.testing import CliRunner
+import pytest
+from annotated_types import Interval, Len, Predicate
 from pydantic import BaseModel, Field
 
 from wry import AutoOption, WryModel, generate_click_parameters
+from wry.click_integration import extract_constraint_text, format_constraint_text
 
 
+def is_even(x):
+    return x % 2 == 0
+
+
+# Constraint metadata built once at import rather than per test call
+_INTERVAL = Interval(ge=0, le=10)
+_LEN = Len(min_length=2, max_length=5)
+_PRED = Predicate(is_even)
+
+
+@pytest.mark.xdist_group(name="wry_click_format_constraint_text_edge_cases")
 class TestFormatConstraintTextEdgeCases:
     """Test edge cases for format_constraint_text."""
 
     def test_empty_constraints(self):
         """Test formatting with no constraints."""
-        from wry.click_integration import format_constraint_text
-
         result = format_constraint_text({})
         assert result == []
 
     def test_unknown_constraint_type(self):
         """Test formatting with unknown constraint."""
-        from wry.click_integration import format_constraint_text
-
         result = format_constraint_text({"unknown_constraint": "value"})
         assert result == []
 
     def test_mixed_constraints(self):
         """Test formatting with various constraint types."""
-        from wry.click_integration import format_constraint_text
-
         constraints = {"ge": 0, "le": 100, "multiple_of": 5, "min_length": 3, "max_length": 20}
         result = format_constraint_text(constraints)
         assert any("0-100" in item for item in result) or (">= 0" in result and "<= 100" in result)
@@ -37,36 +44,28 @@ class TestFormatConstraintTextEdgeCases:
         assert "length 3-20" in result
 
 
+@pytest.mark.xdist_group(name="wry_click_extract_constraint_text_edge_cases")
 class TestExtractConstraintTextEdgeCases:
     """Test edge cases for extract_constraint_text."""
 
     def test_no_metadata(self):
         """Test extraction with no metadata."""
-        from wry.click_integration import extract_constraint_text
-
         result = extract_constraint_text([])
         assert result is None
 
     def test_mixed_metadata_types(self):
         """Test extraction with various metadata types."""
-        from annotated_types import Interval, Len, Predicate
-
-        from wry.click_integration import extract_constraint_text
-
-        def is_even(x):
-            return x % 2 == 0
-
-        # Test individual constraints
-        interval_result = extract_constraint_text(Interval(ge=0, le=10))
+        interval_result = extract_constraint_text(_INTERVAL)
         assert interval_result is not None and ">= 0" in interval_result and "<= 10" in interval_result
 
-        len_result = extract_constraint_text(Len(min_length=2, max_length=5))
+        len_result = extract_constraint_text(_LEN)
         assert len_result is not None and ("length 2-5" in len_result or "min length 2 AND max length 5" in len_result)
 
-        predicate_result = extract_constraint_text(Predicate(is_even))
+        predicate_result = extract_constraint_text(_PRED)
         assert predicate_result is not None and "is_even" in predicate_result
 
 
+@pytest.mark.xdist_group(name="wry_click_generate_click_parameters_edge_cases")
 class TestGenerateClickParametersEdgeCases:
     """Test generate_click_parameters edge cases."""
 
@@ -80,12 +79,12 @@ class TestGenerateClickParametersEdgeCases:
         @click.command()
         @generate_click_parameters(PlainModel)
         def cmd(**kwargs: Any):
-            click.echo(str(kwargs))
+            return kwargs
 
-        # Should work but add no parameters
-        runner = CliRunner()
-        result = runner.invoke(cmd, [])
-        assert result.exit_code == 0
+        # Should work but add no field parameters - only --config and --show-env-vars
+        assert [p.name for p in cmd.params] == ["config", "show_env_vars"]
+        ctx = cmd.make_context("cmd", [])
+        assert cmd.invoke(ctx) == {}
 
     def test_duplicate_application_non_strict(self):
         """Test duplicate decorator application with strict=False."""
@@ -124,7 +123,7 @@ class TestGenerateClickParametersEdgeCases:
         result = not_a_command(name="test")
         assert result == {"name": "test"}
 
-    def test_with_existing_params(self):
+    def test_with_existing_params(self, runner):
         """Test decorator on command with existing parameters."""
 
         class Config(WryModel):
@@ -137,7 +136,6 @@ class TestGenerateClickParametersEdgeCases:
             config = Config(**kwargs)
             click.echo(f"{existing} {config.extra}")
 
-        runner = CliRunner()
         result = runner.invoke(cmd, ["--existing", "hello", "--extra", "world"])
 
         assert result.exit_code == 0
@@ -154,18 +152,11 @@ class TestGenerateClickParametersEdgeCases:
         @click.command()
         @generate_click_parameters(Config)
         def cmd(**kwargs: Any):
-            # kwargs will have class_ and for_
-            click.echo(f"class_={kwargs.get('class_')}, for_={kwargs.get('for_')}")
-
-        runner = CliRunner()
-        # Click converts underscore to hyphen in option names
-        result = runner.invoke(cmd, ["--class-", "MyClass", "--for-", "10"])
+            pass
 
-        # Debug output
-        if result.exit_code != 0:
-            print(f"Exit code: {result.exit_code}")
-            print(f"Output: {result.output}")
+        # Click converts underscore to hyphen in option names; parsing alone is under test
+        ctx = cmd.make_context("cmd", ["--class-", "MyClass", "--for-", "10"])
 
-        assert result.exit_code == 0
-        assert "class_=MyClass" in result.output
-        assert "for_=10" in result.output
+        # params will have class_ and for_
+        assert ctx.params["class_"] == "MyClass"
+        assert ctx.params["for_"] == 10
@@ -1,10 +1,12 @@
 """Extended tests for Click integration to achieve 100% coverage."""
 
-from typing import Annotated, Any
+import functools
+from enum import Enum
+from typing import Annotated, Any, ClassVar
 
 import click
 import pytest
-from click.testing import CliRunner
+from annotated_types import Ge, Interval, Le, Len, Timezone
 from pydantic import Field
 
 from wry import (
@@ -17,12 +19,54 @@ from wry import (
     generate_click_parameters,
 )
 from wry.click_integration import (
+    _FIELD_PARAMETER_CACHE,
     _extract_predicate_description,
     extract_and_modify_argument_decorator,
     extract_constraint_text,
     format_constraint_text,
 )
 
+# Models and commands shared across tests - built once per session
+_BARE_COMMAND = click.Command("test")
+
+
+@functools.cache
+def _build_cmd(model_class: type[WryModel], add_config_option: bool = True) -> click.Command:
+    """Build (once) a no-op command with parameters generated from ``model_class``."""
+
+    @click.command()
+    @generate_click_parameters(model_class, add_config_option=add_config_option)
+    def cmd(**kwargs: Any):
+        pass
+
+    return cmd
+
+
+class _UnionTypesConfig(WryModel):
+    # Using Union syntax compatible with Python 3.9
+    value: str | None = Field(default=None)
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class _CustomTypeConfig(WryModel):
+    color: Annotated[Color, AutoOption] = Field(default=Color.RED)
+
+
+class _NoConfigOptionConfig(WryModel):
+    value: Annotated[int, AutoOption] = Field(default=1)
+
+
+class _ExplicitOptionConfig(WryModel):
+    custom: Annotated[str, click.option("--custom-name", "-c")] = Field(default="test")
+
+
+class _ExplicitArgumentConfig(WryModel):
+    filename: Annotated[str, click.argument("input_file")] = Field()
+
 
 class TestFormatConstraintText:
     """Test format_constraint_text function."""
@@ -67,69 +111,64 @@ class TestFormatConstraintText:
         result = format_constraint_text(constraints)
         assert "multiple of 5" in result
 
+    def test_cached_result_is_fresh_list(self):
+        """Test that repeated calls return independent lists."""
+        first = format_constraint_text({"ge": 0, "le": 100})
+        first.append("mutated")
+        assert format_constraint_text({"ge": 0, "le": 100}) == [">= 0", "<= 100"]
+
+    def test_cache_distinguishes_value_types(self):
+        """Test that equal values of different types are formatted separately."""
+        assert format_constraint_text({"ge": 1}) == [">= 1"]
+        assert format_constraint_text({"ge": 1.0}) == [">= 1.0"]
+
+    def test_unhashable_value(self):
+        """Test formatting a constraint value that can't be cached."""
+        assert format_constraint_text({"multiple_of": [5]}) == ["multiple of [5]"]
+
 
 class TestExtractConstraintText:
     """Test extract_constraint_text function."""
 
     def test_grouped_metadata(self):
         """Test extracting from GroupedMetadata."""
-        try:
-            from annotated_types import Ge, Le
+        # Test individual constraints since GroupedMetadata is a protocol
+        ge_constraint = Ge(0)
+        le_constraint = Le(100)
 
-            # Test individual constraints since GroupedMetadata is a protocol
-            ge_constraint = Ge(0)
-            le_constraint = Le(100)
+        ge_result = extract_constraint_text(ge_constraint)
+        le_result = extract_constraint_text(le_constraint)
 
-            ge_result = extract_constraint_text(ge_constraint)
-            le_result = extract_constraint_text(le_constraint)
-
-            assert ">= 0" in ge_result
-            assert "<= 100" in le_result
-        except ImportError:
-            pytest.skip("annotated_types not available")
+        assert ">= 0" in ge_result
+        assert "<= 100" in le_result
 
     def test_interval_constraint(self):
         """Test extracting from Interval constraint."""
-        try:
-            from annotated_types import Interval
-
-            interval = Interval(gt=0, lt=100)
-            result = extract_constraint_text(interval)
-            assert "> 0" in result
-            assert "< 100" in result
-        except ImportError:
-            pytest.skip("annotated_types not available")
+        interval = Interval(gt=0, lt=100)
+        result = extract_constraint_text(interval)
+        assert "> 0" in result
+        assert "< 100" in result
 
     def test_len_constraint(self):
         """Test extracting from Len constraint."""
-        try:
-            from annotated_types import Len
-
-            # Len constraint with min/max
-            # Note: The actual Len implementation might differ
-            len_constraint = Len(min_length=3, max_length=10)
-            result = extract_constraint_text(len_constraint)
-            if result:  # May not be implemented yet
-                assert "3" in result or "10" in result
-        except (ImportError, TypeError):
-            pytest.skip("annotated_types not available or Len signature different")
+        # Len constraint with min/max
+        # Note: The actual Len implementation might differ
+        len_constraint = Len(min_length=3, max_length=10)
+        result = extract_constraint_text(len_constraint)
+        if result:  # May not be implemented yet
+            assert "3" in result or "10" in result
 
     def test_timezone_constraint(self):
         """Test extracting from Timezone constraint."""
-        try:
-            from annotated_types import Timezone
+        # Naive datetime
+        tz_naive = Timezone(None)
+        result = extract_constraint_text(tz_naive)
+        assert "naive datetime" in result
 
-            # Naive datetime
-            tz_naive = Timezone(None)
-            result = extract_constraint_text(tz_naive)
-            assert "naive datetime" in result
-
-            # Any timezone
-            tz_any = Timezone(...)
-            result = extract_constraint_text(tz_any)
-            assert "any timezone-aware" in result
-        except ImportError:
-            pytest.skip("annotated_types not available")
+        # Any timezone
+        tz_any = Timezone(...)
+        result = extract_constraint_text(tz_any)
+        assert "any timezone-aware" in result
 
     def test_slice_constraint(self):
         """Test extracting from slice objects."""
@@ -157,6 +196,17 @@ class TestExtractConstraintText:
         result = extract_constraint_text(UnknownConstraint())
         assert result is None
 
+    def test_structural_grouped_metadata(self):
+        """Test GroupedMetadata matched by protocol rather than subclassing."""
+
+        class Bounds:
+            __is_annotated_types_grouped_metadata__ = True
+
+            def __iter__(self):
+                return iter((Ge(1), Le(9)))
+
+        assert extract_constraint_text(Bounds()) == ">= 1 AND <= 9"
+
 
 class TestPredicateDescription:
     """Test _extract_predicate_description function."""
@@ -191,45 +241,41 @@ class TestPredicateDescription:
         result = _extract_predicate_description(lambda_func)
         assert isinstance(result, str)  # Should return some description
 
+    def test_description_cached_per_function(self, monkeypatch):
+        """Test that a predicate's source is only inspected once."""
+        predicate = lambda x: x > 0  # noqa: E731
+        first = _extract_predicate_description(predicate)
 
-class TestComplexFieldTypes:
-    """Test complex field type handling."""
+        def fail_getsource(obj):
+            raise AssertionError("source inspected again")
 
-    def test_union_types_python39(self):
-        """Test handling of Union types in Python 3.9+."""
+        monkeypatch.setattr("wry.click_integration.inspect.getsource", fail_getsource)
+        assert _extract_predicate_description(predicate) == first
 
-        class TestConfig(WryModel):
-            # Using Union syntax compatible with Python 3.9
-            value: str | None = Field(default=None)
+    def test_unhashable_predicate(self):
+        """Test that predicates that can't be cached are still described."""
 
-        @click.command()
-        @generate_click_parameters(TestConfig)
-        def test_command(**kwargs: Any):
-            pass
-
-        # Should not raise an error
-        runner = CliRunner()
-        result = runner.invoke(test_command, ["--help"])
-        assert result.exit_code == 0
+        class Check:
+            __hash__ = None  # type: ignore[assignment]
 
-    def test_custom_type_field(self):
-        """Test fields with custom types."""
-        from enum import Enum
+            def __call__(self, x):
+                return True
 
-        class Color(Enum):
-            RED = "red"
-            GREEN = "green"
+        assert _extract_predicate_description(Check()) == "custom predicate"
 
-        class TestConfig(WryModel):
-            color: Annotated[Color, AutoOption] = Field(default=Color.RED)
 
-        @click.command()
-        @generate_click_parameters(TestConfig)
-        def test_command(**kwargs: Any):
-            pass
+class TestComplexFieldTypes:
+    """Test complex field type handling."""
 
-        runner = CliRunner()
-        result = runner.invoke(test_command, ["--help"])
+    @pytest.mark.parametrize(
+        "model_class",
+        [_UnionTypesConfig, _CustomTypeConfig],
+        ids=["union-python39", "custom-enum-type"],
+    )
+    def test_field_type_help_renders(self, runner, model_class):
+        """Test that Union and custom (Enum) field types generate working options."""
+        # Should not raise an error
+        result = runner.invoke(_build_cmd(model_class), ["--help"])
         assert result.exit_code == 0
 
 
@@ -246,30 +292,35 @@ class TestConfigOption:
             pass
 
         # Check that the command has the config option
-        assert any(param.name == "config" for param in test_command.params)
+        assert "config" in {param.name for param in test_command.params}
 
 
 class TestEagerJsonConfig:
     """Test eager_json_config callback."""
 
-    def test_resilient_parsing(self):
+    @pytest.fixture
+    def fresh_ctx(self):
+        """Factory for new contexts on one shared parameterless command."""
+        return lambda: click.Context(_BARE_COMMAND)
+
+    def test_resilient_parsing(self, fresh_ctx):
         """Test that eager_json_config returns early during resilient parsing."""
-        ctx = click.Context(click.Command("test"))
+        ctx = fresh_ctx()
         ctx.resilient_parsing = True
 
         result = eager_json_config(ctx, None, "config.json")
         assert result == "config.json"
 
-    def test_no_value(self):
+    def test_no_value(self, fresh_ctx):
         """Test that eager_json_config returns early with no value."""
-        ctx = click.Context(click.Command("test"))
+        ctx = fresh_ctx()
 
         result = eager_json_config(ctx, None, None)
         assert result is None
 
-    def test_invalid_json_file(self, tmp_path):
+    def test_invalid_json_file(self, fresh_ctx, tmp_path):
         """Test eager_json_config with invalid JSON."""
-        ctx = click.Context(click.Command("test"))
+        ctx = fresh_ctx()
 
         # Create invalid JSON file
         bad_json = tmp_path / "bad.json"
@@ -278,6 +329,18 @@ class TestEagerJsonConfig:
         with pytest.raises(click.BadParameter, match="Config file error"):
             eager_json_config(ctx, None, str(bad_json))
 
+    def test_json_from_stdin(self, fresh_ctx, monkeypatch):
+        """Test that a value of '-' reads the JSON config from stdin."""
+        import io
+
+        ctx = fresh_ctx()
+        monkeypatch.setattr("sys.stdin", io.StringIO('{"name": "from-stdin"}'))
+
+        result = eager_json_config(ctx, None, "-")
+
+        assert result == "-"
+        assert ctx.obj["json_data"] == {"name": "from-stdin"}
+
     def test_modify_click_parameters(self, tmp_path):
         """Test that eager_json_config modifies Click parameters."""
 
@@ -306,6 +369,30 @@ class TestEagerJsonConfig:
         # JSON data should be stored in context for later use
         assert ctx.obj.get("json_data") == {"required_arg": "from-json", "optional": "also-json"}
 
+    def test_repeat_loads_get_fresh_data(self, fresh_ctx, tmp_path):
+        """Test that loading the same file twice gives independent dicts."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"tags": ["a"]}')
+
+        first = fresh_ctx()
+        eager_json_config(first, None, str(config_file))
+        first.obj["json_data"]["tags"].append("mutated")
+
+        second = fresh_ctx()
+        eager_json_config(second, None, str(config_file))
+        assert second.obj["json_data"] == {"tags": ["a"]}
+
+    def test_rewritten_file_is_reloaded(self, fresh_ctx, tmp_path):
+        """Test that a config file rewritten with same-size content is read again."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"port": 8080}')
+        eager_json_config(fresh_ctx(), None, str(config_file))
+
+        config_file.write_text('{"port": 9090}')
+        ctx = fresh_ctx()
+        eager_json_config(ctx, None, str(config_file))
+        assert ctx.obj["json_data"] == {"port": 9090}
+
 
 class TestExtractAndModifyArgument:
     """Test extract_and_modify_argument_decorator function."""
@@ -363,6 +450,33 @@ class TestExtractAndModifyArgument:
         # Without proper closure, no required attribute is extracted
         assert "required" not in info or info.get("required") is None
 
+    def test_repeat_extraction_uses_cached_result(self):
+        """Test that a decorator is only inspected once."""
+        original = click.argument("filename", required=True)
+        modified, info = extract_and_modify_argument_decorator(original)
+        info["param_decls"] = ["mutated"]
+
+        again, again_info = extract_and_modify_argument_decorator(original)
+
+        assert again is modified
+        # Callers get their own copy of the info dict
+        assert again_info["param_decls"] == ["filename"]
+
+    def test_unwritable_decorator_is_not_cached(self):
+        """Test extraction from an object that doesn't accept attributes."""
+
+        class SlottedDecorator:
+            __slots__ = ()
+            __closure__ = None
+
+            def __call__(self, func):
+                return func
+
+        decorator = SlottedDecorator()
+        first, _ = extract_and_modify_argument_decorator(decorator)
+        second, _ = extract_and_modify_argument_decorator(decorator)
+        assert first is not second
+
 
 class TestBuildConfigWithSources:
     """Test build_config_with_sources function."""
@@ -411,7 +525,7 @@ class TestBuildConfigWithSources:
 class TestRequiredOptionGeneration:
     """Test REQUIRED_OPTION handling."""
 
-    def test_required_option_marker(self):
+    def test_required_option_marker(self, runner):
         """Test that REQUIRED_OPTION forces a field to be required."""
 
         class TestConfig(WryModel):
@@ -426,7 +540,6 @@ class TestRequiredOptionGeneration:
         def test_command(**kwargs: Any):
             pass
 
-        runner = CliRunner()
         result = runner.invoke(test_command, [])
 
         # Should fail because required_field is marked as REQUIRED_OPTION
@@ -434,62 +547,108 @@ class TestRequiredOptionGeneration:
         # Check that the error mentions the missing field
 
 
-class TestAddConfigOption:
-    """Test add_config_option parameter."""
+class TestFieldParameterCache:
+    """Test reuse of generated field parameters across commands."""
 
-    def test_without_config_option(self):
-        """Test generate_click_parameters with add_config_option=False."""
+    def test_commands_share_cached_decorators(self):
+        """Test that a second command reuses the model's cached field decorators."""
 
         class TestConfig(WryModel):
-            value: Annotated[int, AutoOption] = Field(default=1)
+            name: Annotated[str, AutoOption] = Field(default="x")
 
-        @click.command()
-        @generate_click_parameters(TestConfig, add_config_option=False)
-        def test_command(**kwargs: Any):
-            pass
+        first = click.command()(generate_click_parameters(TestConfig)(lambda **kwargs: None))
+        cached = _FIELD_PARAMETER_CACHE[TestConfig]
+        second = click.command()(generate_click_parameters(TestConfig)(lambda **kwargs: None))
+
+        assert _FIELD_PARAMETER_CACHE[TestConfig] is cached
+        # Each command still gets its own Option objects
+        first_name = next(p for p in first.params if p.name == "name")
+        second_name = next(p for p in second.params if p.name == "name")
+        assert first_name is not second_name
+
+    def test_env_var_change_rebuilds(self, monkeypatch):
+        """Test that setting a required field's env var rebuilds its option."""
+
+        class TestConfig(WryModel):
+            wry_env_prefix: ClassVar[str] = "CACHE_TEST_"
+            name: Annotated[str, AutoOption]
+
+        def required_flag() -> bool:
+            cmd = click.command()(generate_click_parameters(TestConfig)(lambda **kwargs: None))
+            return next(p for p in cmd.params if p.name == "name").required
+
+        monkeypatch.delenv("CACHE_TEST_NAME", raising=False)
+        assert required_flag()
+        monkeypatch.setenv("CACHE_TEST_NAME", "from-env")
+        assert not required_flag()
+
+    @pytest.mark.parametrize(
+        "setting,value",
+        [("wry_env_prefix", "RENAMED_"), ("wry_comma_separated_lists", True), ("wry_boolean_off_prefix", "disable")],
+    )
+    def test_class_setting_change_rebuilds(self, monkeypatch, setting, value):
+        """Test that changing a wry_* class setting after generation rebuilds the cached entry."""
+
+        class TestConfig(WryModel):
+            debug: Annotated[bool, AutoOption] = Field(default=False)
+
+        generate_click_parameters(TestConfig)
+        cached = _FIELD_PARAMETER_CACHE[TestConfig]
+
+        monkeypatch.setattr(TestConfig, setting, value)
+        generate_click_parameters(TestConfig)
+
+        assert _FIELD_PARAMETER_CACHE[TestConfig] is not cached
+
+    def test_changed_off_prefix_reaches_new_commands(self, monkeypatch):
+        """Test that a command built after changing wry_boolean_off_prefix uses the new prefix."""
 
+        class TestConfig(WryModel):
+            debug: Annotated[bool, AutoOption] = Field(default=False)
+
+        generate_click_parameters(TestConfig)
+        monkeypatch.setattr(TestConfig, "wry_boolean_off_prefix", "disable")
+        cmd = click.command()(generate_click_parameters(TestConfig)(lambda **kwargs: None))
+
+        debug = next(p for p in cmd.params if p.name == "debug")
+        assert debug.secondary_opts == ["--disable-debug"]
+
+    def test_default_factory_not_cached(self):
+        """Test that models with default_factory fields are rebuilt every time."""
+
+        class TestConfig(WryModel):
+            tags: Annotated[list[str], AutoOption] = Field(default_factory=list)
+
+        generate_click_parameters(TestConfig)
+        assert TestConfig not in _FIELD_PARAMETER_CACHE
+
+
+class TestAddConfigOption:
+    """Test add_config_option parameter."""
+
+    def test_without_config_option(self):
+        """Test generate_click_parameters with add_config_option=False."""
+        param_names = {param.name for param in _build_cmd(_NoConfigOptionConfig, add_config_option=False).params}
         # Should not have --config option
-        assert not any(param.name == "config" for param in test_command.params)
+        assert "config" not in param_names
         # But should still have --show-env-vars
-        assert any(param.name == "show_env_vars" for param in test_command.params)
+        assert "show_env_vars" in param_names
 
 
 class TestExplicitClickDecorators:
     """Test handling of explicit Click decorators in annotations."""
 
     @pytest.mark.filterwarnings("ignore:The parameter.*is used more than once:UserWarning")
-    def test_explicit_option_decorator(self):
+    def test_explicit_option_decorator(self, runner):
         """Test field with explicit click.option in annotation."""
-
-        class TestConfig(WryModel):
-            # Use the actual click.option as annotation
-            custom: Annotated[str, click.option("--custom-name", "-c")] = Field(default="test")
-
-        @click.command()
-        @generate_click_parameters(TestConfig)
-        def test_command(**kwargs: Any):
-            pass
-
         # Should have the custom option
-        runner = CliRunner()
-        result = runner.invoke(test_command, ["--help"])
+        result = runner.invoke(_build_cmd(_ExplicitOptionConfig), ["--help"])
         assert "--custom-name" in result.output
 
-    def test_explicit_argument_decorator(self):
+    def test_explicit_argument_decorator(self, runner):
         """Test field with explicit click.argument in annotation."""
-
-        class TestConfig(WryModel):
-            # Use actual click.argument as annotation
-            filename: Annotated[str, click.argument("input_file")] = Field()
-
-        @click.command()
-        @generate_click_parameters(TestConfig)
-        def test_command(**kwargs: Any):
-            pass
-
         # Should handle the explicit argument
-        runner = CliRunner()
-        result = runner.invoke(test_command, ["--help"])
+        result = runner.invoke(_build_cmd(_ExplicitArgumentConfig), ["--help"])
         assert result.exit_code == 0
 
 
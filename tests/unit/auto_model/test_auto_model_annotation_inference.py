@@ -1,7 +1,9 @@
 """Test AutoWryModel annotation inference from FieldInfo."""
 
-from typing import get_args, get_origin
+from typing import Annotated, Any, get_args, get_origin
 
+import click
+import pytest
 from pydantic import Field
 
 from wry import AutoWryModel, WryOption
@@ -10,38 +12,39 @@ from wry import AutoWryModel, WryOption
 class TestAnnotationInference:
     """Test how AutoWryModel infers types from FieldInfo."""
 
-    def test_field_with_annotation_attribute(self):
-        """Test field where FieldInfo has annotation attribute set."""
-
-        class ModelWithAnnotatedFieldInfo(AutoWryModel):
-            # Field with explicit type annotation
-            value: int = Field(default=10)
-
-        # Check that the field was properly annotated
-        if "value" in ModelWithAnnotatedFieldInfo.__annotations__:
-            annotation = ModelWithAnnotatedFieldInfo.__annotations__["value"]
-            origin = get_origin(annotation)
-            if origin:  # Should be Annotated
-                args = get_args(annotation)
-                # Should have WryOption instance
-                assert any(isinstance(arg, WryOption) for arg in args)
-                # Should preserve int type
-                assert int in args or (args and args[0] is int)
-
-    def test_field_without_annotation_uses_any(self):
-        """Test field without annotation defaults to Any."""
-
-        class ModelWithoutAnnotation(AutoWryModel):
-            # Field with type annotation for Pydantic
-            no_type: str = Field(default="value")
-
-        # The field should have been processed
-        if "no_type" in ModelWithoutAnnotation.__annotations__:
-            annotation = ModelWithoutAnnotation.__annotations__["no_type"]
-            origin = get_origin(annotation)
-            if origin:  # Should be Annotated
-                args = get_args(annotation)
-                # Should have WryOption instance added
-                assert any(isinstance(arg, WryOption) for arg in args)
-                # Type should be preserved
-                assert str in args or (args and args[0] is str)
+    @pytest.mark.parametrize("field_type,default", [(int, 10), (str, "value")], ids=["int", "str"])
+    def test_plain_field_gets_wry_option(self, field_type, default):
+        """Test that a plain typed Field() is rewritten to Annotated[type, WryOption()]."""
+        model = type(
+            "Model",
+            (AutoWryModel,),
+            {"__annotations__": {"value": field_type}, "value": Field(default=default)},
+        )
+
+        annotation = model.__annotations__["value"]
+        assert get_origin(annotation) is Annotated
+        args = get_args(annotation)
+        # Should preserve the field type and add a WryOption instance
+        assert args[0] is field_type
+        assert any(isinstance(arg, WryOption) for arg in args[1:])
+
+    def test_union_member_order_is_preserved(self, runner):
+        """Test that str | int keeps its member order after int | str was wrapped."""
+
+        class First(AutoWryModel):
+            x: int | str = Field(default=1)
+
+        class Second(AutoWryModel):
+            y: str | int = Field(default="007")
+
+        assert get_args(First.__annotations__["x"])[0].__args__ == (int, str)
+        assert get_args(Second.__annotations__["y"])[0].__args__ == (str, int)
+
+        @click.command()
+        @Second.generate_click_parameters()
+        def cmd(**kwargs: Any):
+            click.echo(repr(Second(**kwargs).y))
+
+        result = runner.invoke(cmd, ["--y", "007"])
+        assert result.exit_code == 0
+        assert "'007'" in result.output
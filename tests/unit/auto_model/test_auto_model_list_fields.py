@@ -4,133 +4,230 @@ This module tests that AutoWryModel correctly auto-generates Click options
 with multiple=True for list type fields, without requiring manual decoration.
 """
 
-from typing import Any
+import functools
+import json
+from typing import Any, get_origin
 
 import click
-from click.testing import CliRunner
+import pytest
 from pydantic import Field
 
-from wry import AutoWryModel
+from wry import AutoWryModel, create_auto_model
 
 
-class TestAutoModelListFields:
-    """Test AutoWryModel automatic handling of list fields."""
+# Models whose commands are invoked several times are built once per module
+@pytest.fixture(scope="module")
+def list_str_cmd():
+    """Command for a model with list[str] tags and a name."""
 
-    def test_list_str_auto_generates_multiple_option(self):
-        """Test that list[str] automatically gets multiple=True."""
+    class Config(AutoWryModel):
+        """Config with list field."""
 
-        class Config(AutoWryModel):
-            """Config with list field."""
+        tags: list[str] = Field(
+            default_factory=list,
+            description="Tags to apply",
+        )
+        name: str = Field(default="test", description="Name")
 
-            tags: list[str] = Field(
-                default_factory=list,
-                description="Tags to apply",
-            )
-            name: str = Field(default="test", description="Name")
+    @click.command()
+    @Config.generate_click_parameters()
+    @click.pass_context
+    def cmd(ctx: click.Context, **kwargs: Any):
+        """Test command."""
+        config = Config.from_click_context(ctx, **kwargs)
+        click.echo(f"Name: {config.name}\nTags: {config.tags}\nTags type: {type(config.tags).__name__}")
+        return config
 
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            """Test command."""
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Name: {config.name}")
-            click.echo(f"Tags: {config.tags}")
-            click.echo(f"Tags type: {type(config.tags).__name__}")
-            return config
+    return cmd
 
-        runner = CliRunner()
 
-        # Test with no tags - should get empty list
-        result = runner.invoke(cmd, ["--name", "Alice"])
-        assert result.exit_code == 0, f"Failed: {result.output}"
-        assert "Name: Alice" in result.output
-        assert "Tags: []" in result.output
-        assert "Tags type: list" in result.output
+@pytest.fixture(scope="module")
+def list_default_cmd():
+    """Command for a model with list[str] tags that have a default."""
 
-        # Test with single tag
-        result = runner.invoke(cmd, ["--name", "Bob", "--tags", "python"])
-        assert result.exit_code == 0, f"Failed: {result.output}"
-        assert "Name: Bob" in result.output
-        assert "Tags: ['python']" in result.output
-        assert "Tags type: list" in result.output
+    class Config(AutoWryModel):
+        """Config with list field having default."""
 
-        # Test with multiple tags (passed multiple times)
-        result = runner.invoke(cmd, ["--tags", "python", "--tags", "rust", "--tags", "go"])
-        assert result.exit_code == 0, f"Failed: {result.output}"
-        assert "Tags: ['python', 'rust', 'go']" in result.output
-        assert "Tags type: list" in result.output
+        tags: list[str] = Field(
+            default=["default1", "default2"],
+            description="Tags",
+        )
 
-    def test_list_str_with_default_values(self):
-        """Test list[str] with default values."""
+    @click.command()
+    @Config.generate_click_parameters()
+    @click.pass_context
+    def cmd(ctx: click.Context, **kwargs: Any):
+        """Test command."""
+        config = Config.from_click_context(ctx, **kwargs)
+        click.echo(f"Tags: {config.tags}")
+        return config
 
-        class Config(AutoWryModel):
-            """Config with list field having default."""
+    return cmd
 
-            tags: list[str] = Field(
-                default=["default1", "default2"],
-                description="Tags",
-            )
 
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            """Test command."""
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Tags: {config.tags}")
-            return config
+@pytest.fixture(scope="module")
+def constrained_list_cmd():
+    """Command for a model whose list[str] tags must have 1-5 items."""
 
-        runner = CliRunner()
+    class Config(AutoWryModel):
+        """Config with constrained list field."""
 
-        # No tags provided - should use default
-        result = runner.invoke(cmd, [])
-        assert result.exit_code == 0
-        assert "Tags: ['default1', 'default2']" in result.output
+        tags: list[str] = Field(
+            default_factory=list,
+            min_length=1,
+            max_length=5,
+            description="Tags (1-5 required)",
+        )
 
-        # Override with new tags
-        result = runner.invoke(cmd, ["--tags", "new1", "--tags", "new2"])
-        assert result.exit_code == 0
-        assert "Tags: ['new1', 'new2']" in result.output
+    @click.command()
+    @Config.generate_click_parameters()
+    @click.pass_context
+    def cmd(ctx: click.Context, **kwargs: Any):
+        """Test command."""
+        config = Config.from_click_context(ctx, **kwargs)
+        click.echo(f"Tags: {config.tags}")
+        return config
 
-    def test_list_int_auto_generates_multiple_option(self):
-        """Test that list[int] automatically gets multiple=True with proper type."""
+    return cmd
 
-        class Config(AutoWryModel):
-            """Config with list[int] field."""
 
-            counts: list[int] = Field(
-                default_factory=list,
-                description="Count values",
-            )
+@pytest.fixture(scope="module")
+def list_source_cmd():
+    """Command that echoes list[str] tags and their source."""
 
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            """Test command."""
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Counts: {config.counts}")
-            click.echo(f"Counts type: {type(config.counts).__name__}")
-            for count in config.counts:
-                click.echo(f"Item type: {type(count).__name__}")
-            return config
+    class Config(AutoWryModel):
+        """Config with list field."""
+
+        tags: list[str] = Field(default=["default"], description="Tags")
+
+    @click.command()
+    @Config.generate_click_parameters()
+    @click.pass_context
+    def cmd(ctx: click.Context, **kwargs: Any):
+        """Test command."""
+        config = Config.from_click_context(ctx, **kwargs)
+        click.echo(f"Tags: {config.tags}\nTags source: {config.source.tags.value}")
+        return config
+
+    return cmd
+
+
+@pytest.fixture(scope="module")
+def list_json_cmd():
+    """Command that echoes list[str] tags, a name, and both sources."""
+
+    class Config(AutoWryModel):
+        """Config with list field."""
+
+        tags: list[str] = Field(default_factory=list, description="Tags")
+        name: str = Field(default="test", description="Name")
+
+    @click.command()
+    @Config.generate_click_parameters()
+    @click.pass_context
+    def cmd(ctx: click.Context, **kwargs: Any):
+        """Test command."""
+        config = Config.from_click_context(ctx, **kwargs)
+        click.echo(
+            f"Name: {config.name}\n"
+            f"Tags: {config.tags}\n"
+            f"Name source: {config.source.name.value}\n"
+            f"Tags source: {config.source.tags.value}"
+        )
+        return config
+
+    return cmd
+
+
+@functools.cache
+def _single_field_cmd(name: str, annotation: Any) -> click.Command:
+    """Build (once) a command for a model with one empty-by-default collection field."""
+    Config = create_auto_model(
+        "Config",
+        {name: (annotation, Field(default_factory=get_origin(annotation), description=name.title()))},
+    )
+
+    @click.command()
+    @Config.generate_click_parameters()
+    @click.pass_context
+    def cmd(ctx: click.Context, **kwargs: Any):
+        """Test command."""
+        value = getattr(Config.from_click_context(ctx, **kwargs), name)
+        click.echo(f"Value: {value}\nValue type: {type(value).__name__}\nLength: {len(value)}")
+        if value:
+            click.echo(f"Item type: {type(value[0]).__name__}")
+
+    return cmd
+
+
+class TestAutoModelListFields:
+    """Test AutoWryModel automatic handling of list fields."""
+
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            # No tags - should get empty list
+            (["--name", "Alice"], ["Name: Alice", "Tags: []"]),
+            # Single tag
+            (["--name", "Bob", "--tags", "python"], ["Name: Bob", "Tags: ['python']"]),
+            # Multiple tags (passed multiple times)
+            (["--tags", "python", "--tags", "rust", "--tags", "go"], ["Tags: ['python', 'rust', 'go']"]),
+        ],
+        ids=["empty", "single", "multiple"],
+    )
+    def test_list_str_auto_generates_multiple_option(self, list_str_cmd, runner, args, expected):
+        """Test that list[str] automatically gets multiple=True."""
+        result = runner.invoke(list_str_cmd, args)
+        assert result.exit_code == 0, f"Failed: {result.output}"
+        for line in expected:
+            assert line in result.output
+        assert "Tags type: list" in result.output
 
-        runner = CliRunner()
+    def test_list_str_with_default_values(self, list_default_cmd, runner):
+        """Test list[str] with default values."""
+
+        # No tags provided - should use default
+        result = runner.invoke(list_default_cmd, [])
+        assert result.exit_code == 0
+        assert "Tags: ['default1', 'default2']" in result.output
 
-        # Test with no counts
-        result = runner.invoke(cmd, [])
+        # Override with new tags
+        result = runner.invoke(list_default_cmd, ["--tags", "new1", "--tags", "new2"])
         assert result.exit_code == 0
-        assert "Counts: []" in result.output
+        assert "Tags: ['new1', 'new2']" in result.output
 
-        # Test with integer values
-        result = runner.invoke(cmd, ["--counts", "1", "--counts", "2", "--counts", "3"])
+    @pytest.mark.parametrize(
+        "annotation,name,args,expected",
+        [
+            # No values - default_factory gives an empty collection
+            (list[str], "tags", [], ["Value: []", "Value type: list", "Length: 0"]),
+            (list[int], "counts", [], ["Value: []", "Value type: list", "Length: 0"]),
+            # Values are converted to the element type
+            (
+                list[int],
+                "counts",
+                ["--counts", "1", "--counts", "2", "--counts", "3"],
+                ["Value: [1, 2, 3]", "Item type: int"],
+            ),
+            (list[bool], "flags", ["--flags", "true", "--flags", "false"], ["Value: [True, False]", "Item type: bool"]),
+            # Tuples also get multiple=True
+            (
+                tuple[str, ...],
+                "values",
+                ["--values", "a", "--values", "b", "--values", "c"],
+                ["Value: ('a', 'b', 'c')", "Value type: tuple"],
+            ),
+        ],
+        ids=["str-empty", "int-empty", "int-values", "bool-values", "tuple-values"],
+    )
+    def test_collection_field_auto_generates_multiple_option(self, runner, annotation, name, args, expected):
+        """Test that list and tuple fields automatically get multiple=True."""
+        result = runner.invoke(_single_field_cmd(name, annotation), args)
         assert result.exit_code == 0, f"Failed: {result.output}"
-        assert "Counts: [1, 2, 3]" in result.output
-        assert "Counts type: list" in result.output
-        assert "Item type: int" in result.output
+        for line in expected:
+            assert line in result.output
 
-    def test_multiple_list_fields(self):
+    def test_multiple_list_fields(self, runner):
         """Test multiple list fields in same model."""
 
         class Config(AutoWryModel):
@@ -146,13 +243,9 @@ class TestAutoModelListFields:
         def cmd(ctx: click.Context, **kwargs: Any):
             """Test command."""
             config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Tags: {config.tags}")
-            click.echo(f"Ports: {config.ports}")
-            click.echo(f"Flags: {config.flags}")
+            click.echo(f"Tags: {config.tags}\nPorts: {config.ports}\nFlags: {config.flags}")
             return config
 
-        runner = CliRunner()
-
         # Test all list fields together
         result = runner.invoke(
             cmd,
@@ -176,58 +269,25 @@ class TestAutoModelListFields:
         assert "Ports: [80, 443]" in result.output
         assert "Flags: [True, False]" in result.output
 
-    def test_list_field_with_constraints(self):
-        """Test list[str] with Pydantic constraints."""
-
-        class Config(AutoWryModel):
-            """Config with constrained list field."""
-
-            tags: list[str] = Field(
-                default_factory=list,
-                min_length=1,
-                max_length=5,
-                description="Tags (1-5 required)",
-            )
-
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            """Test command."""
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Tags: {config.tags}")
-            return config
-
-        runner = CliRunner()
-
-        # Valid: within constraints
-        result = runner.invoke(cmd, ["--tags", "a", "--tags", "b", "--tags", "c"])
+    def test_list_field_with_constraints(self, constrained_list_cmd, runner):
+        """Test list[str] with Pydantic constraints accepts a list within them."""
+        result = runner.invoke(constrained_list_cmd, ["--tags", "a", "--tags", "b", "--tags", "c"])
         assert result.exit_code == 0, f"Failed: {result.output}"
         assert "Tags: ['a', 'b', 'c']" in result.output
 
-        # Invalid: empty list violates min_length=1
-        result = runner.invoke(cmd, [])
-        assert result.exit_code != 0, "Should fail validation"
-
-        # Invalid: too many items (max_length=5)
-        result = runner.invoke(
-            cmd,
-            [
-                "--tags",
-                "a",
-                "--tags",
-                "b",
-                "--tags",
-                "c",
-                "--tags",
-                "d",
-                "--tags",
-                "e",
-                "--tags",
-                "f",
-            ],
-        )
-        assert result.exit_code != 0, "Should fail validation"
+    @pytest.mark.parametrize(
+        "args",
+        [
+            # Empty list violates min_length=1
+            [],
+            # Too many items (max_length=5)
+            [arg for tag in "abcdef" for arg in ("--tags", tag)],
+        ],
+        ids=["too-few", "too-many"],
+    )
+    def test_list_field_constraint_violations(self, constrained_list_cmd, invoke_exit_code, args):
+        """Test list[str] with Pydantic constraints rejects lists outside them."""
+        assert invoke_exit_code(constrained_list_cmd, args) != 0, "Should fail validation"
 
     def test_list_field_help_text(self):
         """Test that list fields show appropriate help text."""
@@ -246,133 +306,55 @@ class TestAutoModelListFields:
             """Test command."""
             pass
 
-        runner = CliRunner()
-        result = runner.invoke(cmd, ["--help"])
-        assert result.exit_code == 0
+        help_text = cmd.get_help(click.Context(cmd))
         # Should show the option
-        assert "--tags" in result.output
+        assert "--tags" in help_text
         # Should show the description
-        assert "Tags to apply" in result.output or "can be specified multiple times" in result.output
+        assert "Tags to apply" in help_text or "can be specified multiple times" in help_text
 
-    def test_list_field_source_tracking(self):
+    def test_list_field_source_tracking(self, list_source_cmd, runner):
         """Test that source tracking works correctly for list fields."""
 
-        class Config(AutoWryModel):
-            """Config with list field."""
-
-            tags: list[str] = Field(default=["default"], description="Tags")
-
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            """Test command."""
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Tags: {config.tags}")
-            click.echo(f"Tags source: {config.source.tags.value}")
-            return config
-
-        runner = CliRunner()
-
         # Default value
-        result = runner.invoke(cmd, [])
+        result = runner.invoke(list_source_cmd, [])
         assert result.exit_code == 0
         assert "Tags: ['default']" in result.output
         assert "Tags source: default" in result.output
 
         # CLI override
-        result = runner.invoke(cmd, ["--tags", "cli1", "--tags", "cli2"])
+        result = runner.invoke(list_source_cmd, ["--tags", "cli1", "--tags", "cli2"])
         assert result.exit_code == 0
         assert "Tags: ['cli1', 'cli2']" in result.output
         assert "Tags source: cli" in result.output
 
-    def test_empty_list_vs_no_value(self):
-        """Test distinction between empty list and no value provided."""
-
-        class Config(AutoWryModel):
-            """Config with optional list field."""
-
-            tags: list[str] = Field(
-                default_factory=list,
-                description="Optional tags",
-            )
-
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            """Test command."""
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Tags: {config.tags}")
-            click.echo(f"Tags length: {len(config.tags)}")
-            return config
-
-        runner = CliRunner()
-
-        # No tags provided - should use default_factory (empty list)
-        result = runner.invoke(cmd, [])
-        assert result.exit_code == 0
-        assert "Tags: []" in result.output
-        assert "Tags length: 0" in result.output
-
-    def test_list_field_with_json_config(self, tmp_path):
+    @pytest.mark.parametrize(
+        "cli_args,expected_name,expected_tags,source",
+        [
+            # Load from JSON
+            ([], "from-json", "['json1', 'json2', 'json3']", "json"),
+            # CLI overrides JSON
+            (["--tags", "cli1", "--tags", "cli2", "--name", "from-cli"], "from-cli", "['cli1', 'cli2']", "cli"),
+        ],
+        ids=["json", "cli-override"],
+    )
+    def test_list_field_with_json_config(
+        self, tmp_path, list_json_cmd, runner, cli_args, expected_name, expected_tags, source
+    ):
         """Test that list fields work with JSON config files."""
-        import json
-
-        class Config(AutoWryModel):
-            """Config with list field."""
-
-            tags: list[str] = Field(default_factory=list, description="Tags")
-            name: str = Field(default="test", description="Name")
-
         # Create config file
         config_file = tmp_path / "config.json"
         config_data = {"tags": ["json1", "json2", "json3"], "name": "from-json"}
-        config_file.write_text(json.dumps(config_data))
+        with config_file.open("w") as f:
+            json.dump(config_data, f)
 
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            """Test command."""
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Name: {config.name}")
-            click.echo(f"Tags: {config.tags}")
-            click.echo(f"Name source: {config.source.name.value}")
-            click.echo(f"Tags source: {config.source.tags.value}")
-            return config
-
-        runner = CliRunner()
-
-        # Load from JSON
-        result = runner.invoke(cmd, ["--config", str(config_file)])
-        assert result.exit_code == 0, f"Failed: {result.output}"
-        assert "Name: from-json" in result.output
-        assert "Tags: ['json1', 'json2', 'json3']" in result.output
-        assert "Name source: json" in result.output
-        assert "Tags source: json" in result.output
-
-        # CLI overrides JSON
-        result = runner.invoke(
-            cmd,
-            [
-                "--config",
-                str(config_file),
-                "--tags",
-                "cli1",
-                "--tags",
-                "cli2",
-                "--name",
-                "from-cli",
-            ],
-        )
+        result = runner.invoke(list_json_cmd, ["--config", str(config_file), *cli_args])
         assert result.exit_code == 0, f"Failed: {result.output}"
-        assert "Name: from-cli" in result.output
-        assert "Tags: ['cli1', 'cli2']" in result.output
-        assert "Name source: cli" in result.output
-        assert "Tags source: cli" in result.output
+        assert f"Name: {expected_name}" in result.output
+        assert f"Tags: {expected_tags}" in result.output
+        assert f"Name source: {source}" in result.output
+        assert f"Tags source: {source}" in result.output
 
-    def test_list_field_with_env_vars(self):
+    def test_list_field_with_env_vars(self, runner):
         """Test that list fields work with environment variables."""
 
         class Config(AutoWryModel):
@@ -388,12 +370,9 @@ class TestAutoModelListFields:
         def cmd(ctx: click.Context, **kwargs: Any):
             """Test command."""
             config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Tags: {config.tags}")
-            click.echo(f"Tags source: {config.source.tags.value}")
+            click.echo(f"Tags: {config.tags}\nTags source: {config.source.tags.value}")
             return config
 
-        runner = CliRunner()
-
         # Note: Click's envvar handling for multiple values is limited
         # Environment variables don't work well with multiple=True in Click
         # This documents the expected behavior
@@ -402,32 +381,3 @@ class TestAutoModelListFields:
             result = runner.invoke(cmd, [], env={"MYAPP_TAGS": "tag1"})
             # This may or may not work depending on Click's handling
             # The behavior is documented rather than enforced
-
-    def test_tuple_field_auto_generates_multiple_option(self):
-        """Test that tuple fields also get multiple=True."""
-
-        class Config(AutoWryModel):
-            """Config with tuple field."""
-
-            values: tuple[str, ...] = Field(
-                default=(),
-                description="Values",
-            )
-
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            """Test command."""
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Values: {config.values}")
-            click.echo(f"Values type: {type(config.values).__name__}")
-            return config
-
-        runner = CliRunner()
-
-        # Test with multiple values
-        result = runner.invoke(cmd, ["--values", "a", "--values", "b", "--values", "c"])
-        assert result.exit_code == 0, f"Failed: {result.output}"
-        # Tuple should be converted or maintained
-        assert "'a'" in result.output and "'b'" in result.output and "'c'" in result.output
@@ -1,164 +1,155 @@
 """Test boolean on/off flag support."""
 
+import functools
 from typing import Annotated, Any, ClassVar
 
 import click
 import pytest
-from click.testing import CliRunner
 from pydantic import Field
 
 from wry import AutoOption, AutoWryModel, WryModel
 
+# Models are defined once at import; commands are built once per model by _build_cmd
 
-class TestBooleanOnOffFlags:
-    """Test boolean on/off flag generation."""
 
-    def test_default_on_off_pattern(self):
-        """Test that boolean fields generate --option/--no-option by default."""
+class _DefaultFlagsConfig(AutoWryModel):
+    debug: bool = Field(default=False, description="Enable debug mode")
+    enabled: bool = Field(default=True, description="Enable feature")
 
-        class Config(AutoWryModel):
-            debug: bool = Field(default=False, description="Enable debug mode")
-            enabled: bool = Field(default=True, description="Enable feature")
 
-        @click.command()
-        @Config.generate_click_parameters()
-        def cmd(**kwargs: Any):
-            config = Config(**kwargs)
-            return config
+class _OffOptionConfig(AutoWryModel):
+    verbose: Annotated[bool, AutoOption(flag_off_option="quiet")] = Field(default=False, description="Verbose output")
 
-        # Check generated options
-        params_by_name = {p.name: p for p in cmd.params}
 
-        assert "debug" in params_by_name
-        debug_param = params_by_name["debug"]
-        # Should be a flag
-        assert debug_param.is_flag
-        # Should have both on and off options
-        assert "--debug" in debug_param.opts or any(
-            "debug" in opt and "no-debug" in str(debug_param.opts) for opt in debug_param.opts
-        )
+class _OffPrefixConfig(AutoWryModel):
+    enabled: Annotated[bool, AutoOption(flag_off_prefix="disable")] = Field(default=True, description="Enable feature")
 
-        # Test CLI usage
-        runner = CliRunner()
 
-        # Test --debug sets to True
-        result = runner.invoke(cmd, ["--debug"])
-        assert result.exit_code == 0
+class _ModelWideOffPrefixConfig(AutoWryModel):
+    wry_boolean_off_prefix: ClassVar[str] = "disable"
 
-        # Test --no-debug sets to False
-        result = runner.invoke(cmd, ["--no-debug"])
-        assert result.exit_code == 0
+    debug: bool = Field(default=False, description="Debug mode")
+    enabled: bool = Field(default=True, description="Enable feature")
 
-    def test_custom_off_option(self):
-        """Test custom off-option name via AutoOption(flag_off_option=...)."""
 
-        class Config(AutoWryModel):
-            verbose: Annotated[bool, AutoOption(flag_off_option="quiet")] = Field(
-                default=False, description="Verbose output"
-            )
+class _SingleFlagConfig(AutoWryModel):
+    simple: Annotated[bool, AutoOption(flag_enable_on_off=False)] = Field(default=False, description="Simple flag")
 
-        @click.command()
-        @Config.generate_click_parameters()
-        def cmd(**kwargs: Any):
-            config = Config(**kwargs)
-            click.echo(f"Verbose: {config.verbose}")
 
-        # Check that it has --verbose/--quiet
-        runner = CliRunner()
-        result = runner.invoke(cmd, ["--help"])
-        assert "--verbose" in result.output
-        assert "--quiet" in result.output
+class _AliasConfig(AutoWryModel):
+    dbg: bool = Field(alias="debug", default=False, description="Debug mode")
 
-        # Test --verbose sets True
-        result = runner.invoke(cmd, ["--verbose"])
-        assert result.exit_code == 0
-        assert "Verbose: True" in result.output
 
-        # Test --quiet sets False
-        result = runner.invoke(cmd, ["--quiet"])
-        assert result.exit_code == 0
-        assert "Verbose: False" in result.output
+class _WryModelFlagsConfig(WryModel):
+    debug: Annotated[bool, AutoOption()] = Field(default=False, description="Debug mode")
+    verbose: Annotated[bool, AutoOption(flag_off_option="quiet")] = Field(default=False, description="Verbose output")
 
-    def test_custom_off_prefix(self):
-        """Test custom off-prefix via AutoOption(flag_off_prefix=...)."""
 
-        class Config(AutoWryModel):
-            enabled: Annotated[bool, AutoOption(flag_off_prefix="disable")] = Field(
-                default=True, description="Enable feature"
-            )
+class _EnvPrefixConfig(AutoWryModel):
+    wry_env_prefix: ClassVar[str] = "TEST_"
+    debug: bool = Field(default=False, description="Debug mode")
 
-        @click.command()
-        @Config.generate_click_parameters()
-        def cmd(**kwargs: Any):
-            config = Config(**kwargs)
-            click.echo(f"Enabled: {config.enabled}")
 
-        # Check that it has --enabled/--disable-enabled
-        runner = CliRunner()
-        result = runner.invoke(cmd, ["--help"])
-        assert "--enabled" in result.output
-        assert "--disable-enabled" in result.output
+class _RequiredFlagConfig(AutoWryModel):
+    accept: Annotated[bool, AutoOption(required=True)] = Field(description="Accept terms")
 
-        # Test both flags
-        result = runner.invoke(cmd, ["--enabled"])
-        assert result.exit_code == 0
-        assert "Enabled: True" in result.output
-
-        result = runner.invoke(cmd, ["--disable-enabled"])
-        assert result.exit_code == 0
-        assert "Enabled: False" in result.output
-
-    def test_model_wide_off_prefix(self):
-        """Test model-wide wry_boolean_off_prefix ClassVar."""
 
-        class Config(AutoWryModel):
-            wry_boolean_off_prefix: ClassVar[str] = "disable"
+@functools.cache
+def _build_cmd(config_cls: type[WryModel]) -> click.Command:
+    """Build (once) a command that echoes each field as ``name: value (source)``."""
 
-            debug: bool = Field(default=False, description="Debug mode")
-            enabled: bool = Field(default=True, description="Enable feature")
+    @click.command()
+    @config_cls.generate_click_parameters()
+    @click.pass_context
+    def cmd(ctx: click.Context, **kwargs: Any):
+        config = config_cls.from_click_context(ctx, **kwargs)
+        click.echo(
+            "\n".join(
+                f"{name}: {getattr(config, name)} ({getattr(config.source, name).value})"
+                for name in type(config).model_fields
+            )
+        )
 
-        @click.command()
-        @Config.generate_click_parameters()
-        def cmd(**kwargs: Any):
-            pass
+    return cmd
 
-        # Check that all booleans use the custom prefix
-        runner = CliRunner()
-        result = runner.invoke(cmd, ["--help"])
-        assert "--debug" in result.output
-        assert "--disable-debug" in result.output
-        assert "--enabled" in result.output
-        assert "--disable-enabled" in result.output
 
-    def test_opt_out_to_single_flag(self):
-        """Test opting out to single flag via AutoOption(flag_enable_on_off=False)."""
+def _option_names(cmd: click.Command) -> set[str]:
+    """Every option string (on and off) declared by ``cmd``."""
+    return {opt for param in cmd.params for opt in param.opts + param.secondary_opts}
 
-        class Config(AutoWryModel):
-            simple: Annotated[bool, AutoOption(flag_enable_on_off=False)] = Field(
-                default=False, description="Simple flag"
-            )
-
-        @click.command()
-        @Config.generate_click_parameters()
-        def cmd(**kwargs: Any):
-            config = Config(**kwargs)
-            click.echo(f"Simple: {config.simple}")
 
-        # Check that it only has --simple
-        runner = CliRunner()
-        result = runner.invoke(cmd, ["--help"])
-        assert "--simple" in result.output
-        assert "--no-simple" not in result.output
+class TestBooleanOnOffFlags:
+    """Test boolean on/off flag generation."""
 
-        # Test that --simple sets True
-        result = runner.invoke(cmd, ["--simple"])
+    @pytest.mark.parametrize(
+        "config_cls,field,on_args,off_args,present,absent",
+        [
+            # Booleans generate --option/--no-option by default
+            pytest.param(
+                _DefaultFlagsConfig,
+                "debug",
+                ["--debug"],
+                ["--no-debug"],
+                {"--debug", "--no-debug"},
+                set(),
+                id="default",
+            ),
+            # Custom off-option name via AutoOption(flag_off_option=...)
+            pytest.param(
+                _OffOptionConfig,
+                "verbose",
+                ["--verbose"],
+                ["--quiet"],
+                {"--verbose", "--quiet"},
+                set(),
+                id="off-option",
+            ),
+            # Custom off-prefix via AutoOption(flag_off_prefix=...)
+            pytest.param(
+                _OffPrefixConfig,
+                "enabled",
+                ["--enabled"],
+                ["--disable-enabled"],
+                {"--enabled", "--disable-enabled"},
+                set(),
+                id="off-prefix",
+            ),
+            # Opting out to a single flag via AutoOption(flag_enable_on_off=False)
+            pytest.param(
+                _SingleFlagConfig, "simple", ["--simple"], [], {"--simple"}, {"--no-simple"}, id="single-flag"
+            ),
+        ],
+    )
+    def test_on_off_flag_pair(self, runner, config_cls, field, on_args, off_args, present, absent):
+        """Test the generated on/off options and the value each one sets."""
+        cmd = _build_cmd(config_cls)
+
+        # Should be a flag with exactly the expected option names
+        assert {p.name: p for p in cmd.params}[field].is_flag
+        opts = _option_names(cmd)
+        assert present <= opts
+        assert not absent & opts
+
+        # On sets True
+        result = runner.invoke(cmd, on_args)
         assert result.exit_code == 0
-        assert "Simple: True" in result.output
+        assert f"{field}: True" in result.output
 
-        # Test that without flag it's False
-        result = runner.invoke(cmd, [])
+        # Off (or no flag for single flags) sets False
+        result = runner.invoke(cmd, off_args)
         assert result.exit_code == 0
-        assert "Simple: False" in result.output
+        assert f"{field}: False" in result.output
+
+    def test_model_wide_off_prefix(self):
+        """Test model-wide wry_boolean_off_prefix ClassVar."""
+        cmd = _build_cmd(_ModelWideOffPrefixConfig)
+
+        # Check that all booleans use the custom prefix
+        opts = _option_names(cmd)
+        assert "--debug" in opts
+        assert "--disable-debug" in opts
+        assert "--enabled" in opts
+        assert "--disable-enabled" in opts
 
     def test_collision_detection(self):
         """Test collision detection when off-option conflicts with existing field."""
@@ -180,28 +171,19 @@ class TestBooleanOnOffFlags:
         assert "debug" in params_by_name
         assert params_by_name["debug"].is_flag
 
-    def test_boolean_with_alias(self):
+    def test_boolean_with_alias(self, runner):
         """Test that boolean on/off uses alias name."""
-
-        class Config(AutoWryModel):
-            dbg: bool = Field(alias="debug", default=False, description="Debug mode")
-
-        @click.command()
-        @Config.generate_click_parameters()
-        def cmd(**kwargs: Any):
-            config = Config(**kwargs)
-            click.echo(f"Debug: {config.dbg}")
+        cmd = _build_cmd(_AliasConfig)
 
         # Should use alias name for options
-        runner = CliRunner()
-        result = runner.invoke(cmd, ["--help"])
-        assert "--debug" in result.output
-        assert "--no-debug" in result.output
+        opts = _option_names(cmd)
+        assert "--debug" in opts
+        assert "--no-debug" in opts
 
         # Test using alias
         result = runner.invoke(cmd, ["--debug"])
         assert result.exit_code == 0
-        assert "Debug: True" in result.output
+        assert "dbg: True" in result.output
 
     def test_error_both_off_prefix_and_option(self):
         """Test that providing both flag_off_prefix and flag_off_option raises error."""
@@ -220,108 +202,48 @@ class TestBooleanOnOffFlags:
 
     def test_wry_model_with_on_off_flags(self):
         """Test that WryModel also supports on/off flags."""
+        cmd = _build_cmd(_WryModelFlagsConfig)
 
-        class Config(WryModel):
-            debug: Annotated[bool, AutoOption()] = Field(default=False, description="Debug mode")
-            verbose: Annotated[bool, AutoOption(flag_off_option="quiet")] = Field(
-                default=False, description="Verbose output"
-            )
-
-        @click.command()
-        @Config.generate_click_parameters()
-        def cmd(**kwargs: Any):
-            config = Config(**kwargs)
-            click.echo(f"Debug: {config.debug}, Verbose: {config.verbose}")
-
-        runner = CliRunner()
-        result = runner.invoke(cmd, ["--help"])
-
+        opts = _option_names(cmd)
         # Check both patterns
-        assert "--debug" in result.output
-        assert "--no-debug" in result.output
-        assert "--verbose" in result.output
-        assert "--quiet" in result.output
+        assert "--debug" in opts
+        assert "--no-debug" in opts
+        assert "--verbose" in opts
+        assert "--quiet" in opts
 
-    def test_source_tracking_with_on_off_flags(self):
+    def test_source_tracking_with_on_off_flags(self, runner):
         """Test that source tracking works correctly with on/off flags."""
-
-        class Config(AutoWryModel):
-            wry_env_prefix: ClassVar[str] = "TEST_"
-            debug: bool = Field(default=False, description="Debug mode")
-
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Debug: {config.debug}")
-            click.echo(f"Source: {config.source.debug.value}")
-
-        runner = CliRunner()
+        cmd = _build_cmd(_EnvPrefixConfig)
 
         # Test CLI source
         result = runner.invoke(cmd, ["--debug"])
         assert result.exit_code == 0
-        assert "Debug: True" in result.output
-        assert "Source: cli" in result.output
+        assert "debug: True (cli)" in result.output
 
         # Test no-option also tracked as CLI
         result = runner.invoke(cmd, ["--no-debug"])
         assert result.exit_code == 0
-        assert "Debug: False" in result.output
-        assert "Source: cli" in result.output
+        assert "debug: False (cli)" in result.output
 
-    def test_json_config_with_boolean_flags(self):
+    def test_json_config_with_boolean_flags(self, runner):
         """Test that JSON config works with boolean on/off flags."""
-        import tempfile
-
-        class Config(AutoWryModel):
-            debug: bool = Field(default=False, description="Debug mode")
-            enabled: bool = Field(default=True, description="Feature enabled")
-
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Debug: {config.debug}, Enabled: {config.enabled}")
-
-        runner = CliRunner()
+        cmd = _build_cmd(_DefaultFlagsConfig)
 
-        # Create temp JSON config
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write('{"debug": true, "enabled": false}')
-            json_file = f.name
-
-        try:
-            result = runner.invoke(cmd, ["--config", json_file])
-            assert result.exit_code == 0
-            assert "Debug: True" in result.output
-            assert "Enabled: False" in result.output
-        finally:
-            import os
-
-            os.unlink(json_file)
+        # Read the JSON config from stdin - no temp file needed
+        result = runner.invoke(cmd, ["--config", "-"], input='{"debug": true, "enabled": false}')
+        assert result.exit_code == 0
+        assert "debug: True (json)" in result.output
+        assert "enabled: False (json)" in result.output
 
-    def test_required_boolean_with_on_off(self):
+    def test_required_boolean_with_on_off(self, runner):
         """Test required boolean field with on/off pattern."""
-
-        class Config(AutoWryModel):
-            accept: Annotated[bool, AutoOption(required=True)] = Field(description="Accept terms")
-
-        @click.command()
-        @Config.generate_click_parameters()
-        def cmd(**kwargs: Any):
-            config = Config(**kwargs)
-            click.echo(f"Accepted: {config.accept}")
-
-        runner = CliRunner()
+        cmd = _build_cmd(_RequiredFlagConfig)
 
         # Should work with either flag
         result = runner.invoke(cmd, ["--accept"])
         assert result.exit_code == 0
-        assert "Accepted: True" in result.output
+        assert "accept: True" in result.output
 
         result = runner.invoke(cmd, ["--no-accept"])
         assert result.exit_code == 0
-        assert "Accepted: False" in result.output
+        assert "accept: False" in result.output
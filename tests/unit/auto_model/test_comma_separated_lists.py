@@ -7,16 +7,57 @@ to accept comma-separated input instead of multiple invocations.
 from typing import Annotated, Any
 
 import click
-from click.testing import CliRunner
+import pytest
 from pydantic import Field
 
 from wry import AutoWryModel, CommaSeparated
+from wry.comma_separated import CommaSeparatedFloats, CommaSeparatedInts, CommaSeparatedStrings
+
+
+class TestCommaSeparatedParsing:
+    """Test the comma-separated parameter types directly, without a Click command."""
+
+    @pytest.mark.parametrize(
+        "param_type,value,expected",
+        [
+            (CommaSeparatedStrings(), "python,rust,go", ["python", "rust", "go"]),
+            # Single value (no commas)
+            (CommaSeparatedStrings(), "python", ["python"]),
+            # Whitespace is stripped
+            (CommaSeparatedStrings(), "python, rust , go", ["python", "rust", "go"]),
+            # Empty items from repeated or trailing commas are filtered out
+            (CommaSeparatedStrings(), "a,,b,,,c,", ["a", "b", "c"]),
+            (CommaSeparatedStrings(), "", []),
+            # Lists (e.g. from default_factory) pass through unchanged
+            (CommaSeparatedStrings(), ["x", "y"], ["x", "y"]),
+            (CommaSeparatedInts(), "8080,8443,9000", [8080, 8443, 9000]),
+            (CommaSeparatedInts(), "80, 443 , 8080", [80, 443, 8080]),
+            (CommaSeparatedFloats(), "1.5,2.7,3.14", [1.5, 2.7, 3.14]),
+        ],
+        ids=["strings", "single", "whitespace", "empty-items", "empty", "list", "ints", "ints-whitespace", "floats"],
+    )
+    def test_convert(self, param_type, value, expected):
+        """Test parsing comma-separated input."""
+        assert param_type.convert(value, None, None) == expected
+
+    @pytest.mark.parametrize(
+        "param_type,value,match",
+        [
+            (CommaSeparatedInts(), "80,not-a-number,443", "invalid integer"),
+            (CommaSeparatedFloats(), "1.5,invalid,3.14", "invalid float"),
+        ],
+        ids=["ints", "floats"],
+    )
+    def test_convert_invalid(self, param_type, value, match):
+        """Test that invalid numbers are reported as a bad parameter."""
+        with pytest.raises(click.BadParameter, match=match):
+            param_type.convert(value, None, None)
 
 
 class TestCommaSeparatedLists:
     """Test comma-separated list parsing."""
 
-    def test_comma_separated_strings(self):
+    def test_comma_separated_strings(self, runner):
         """Test comma-separated string lists."""
 
         class Config(AutoWryModel):
@@ -37,32 +78,19 @@ class TestCommaSeparatedLists:
             click.echo(f"Count: {len(config.tags)}")
             return config
 
-        runner = CliRunner()
-
         # Test comma-separated input
         result = runner.invoke(cmd, ["--tags", "python,rust,go"])
         assert result.exit_code == 0, f"Failed: {result.output}"
         assert "Tags: ['python', 'rust', 'go']" in result.output
         assert "Count: 3" in result.output
 
-        # Test single value (no commas)
-        result = runner.invoke(cmd, ["--tags", "python"])
-        assert result.exit_code == 0
-        assert "Tags: ['python']" in result.output
-        assert "Count: 1" in result.output
-
         # Test empty/no value
         result = runner.invoke(cmd, [])
         assert result.exit_code == 0
         assert "Tags: []" in result.output
         assert "Count: 0" in result.output
 
-        # Test with whitespace (should be stripped)
-        result = runner.invoke(cmd, ["--tags", "python, rust , go"])
-        assert result.exit_code == 0
-        assert "Tags: ['python', 'rust', 'go']" in result.output
-
-    def test_comma_separated_integers(self):
+    def test_comma_separated_integers(self, runner):
         """Test comma-separated integer lists."""
 
         class Config(AutoWryModel):
@@ -84,24 +112,13 @@ class TestCommaSeparatedLists:
                 click.echo(f"Type: {type(port).__name__}")
             return config
 
-        runner = CliRunner()
-
         # Test comma-separated integers
         result = runner.invoke(cmd, ["--ports", "8080,8443,9000"])
         assert result.exit_code == 0, f"Failed: {result.output}"
         assert "Ports: [8080, 8443, 9000]" in result.output
         assert "Type: int" in result.output
 
-        # Test with whitespace
-        result = runner.invoke(cmd, ["--ports", "80, 443 , 8080"])
-        assert result.exit_code == 0
-        assert "Ports: [80, 443, 8080]" in result.output
-
-        # Test invalid integer
-        result = runner.invoke(cmd, ["--ports", "80,not-a-number,443"])
-        assert result.exit_code != 0  # Should fail
-
-    def test_comma_separated_floats(self):
+    def test_comma_separated_floats(self, runner):
         """Test comma-separated float lists."""
 
         class Config(AutoWryModel):
@@ -123,19 +140,13 @@ class TestCommaSeparatedLists:
                 click.echo(f"Type: {type(val).__name__}")
             return config
 
-        runner = CliRunner()
-
         # Test comma-separated floats
         result = runner.invoke(cmd, ["--values", "1.5,2.7,3.14"])
         assert result.exit_code == 0, f"Failed: {result.output}"
         assert "Values: [1.5, 2.7, 3.14]" in result.output
         assert "Type: float" in result.output
 
-        # Test invalid float
-        result = runner.invoke(cmd, ["--values", "1.5,invalid,3.14"])
-        assert result.exit_code != 0  # Should fail
-
-    def test_mixed_standard_and_comma_separated(self):
+    def test_mixed_standard_and_comma_separated(self, runner):
         """Test mixing standard multiple=True and comma-separated in same model."""
 
         class Config(AutoWryModel):
@@ -163,8 +174,6 @@ class TestCommaSeparatedLists:
             click.echo(f"CSV: {config.csv_tags}")
             return config
 
-        runner = CliRunner()
-
         # Use both types together
         result = runner.invoke(
             cmd,
@@ -181,7 +190,7 @@ class TestCommaSeparatedLists:
         assert "Standard: ['a', 'b']" in result.output
         assert "CSV: ['x', 'y', 'z']" in result.output
 
-    def test_comma_separated_with_default_values(self):
+    def test_comma_separated_with_default_values(self, runner):
         """Test comma-separated with default values."""
 
         class Config(AutoWryModel):
@@ -202,8 +211,6 @@ class TestCommaSeparatedLists:
             click.echo(f"Source: {config.source.tags.value}")
             return config
 
-        runner = CliRunner()
-
         # No input - use default
         result = runner.invoke(cmd, [])
         assert result.exit_code == 0
@@ -216,7 +223,7 @@ class TestCommaSeparatedLists:
         assert "Tags: ['new1', 'new2', 'new3']" in result.output
         assert "Source: cli" in result.output
 
-    def test_comma_separated_with_json_config(self, tmp_path):
+    def test_comma_separated_with_json_config(self, tmp_path, runner):
         """Test comma-separated with JSON config."""
         import json
 
@@ -245,8 +252,6 @@ class TestCommaSeparatedLists:
             click.echo(f"Tags source: {config.source.tags.value}")
             return config
 
-        runner = CliRunner()
-
         # Load from JSON
         result = runner.invoke(cmd, ["--config", str(config_file)])
         assert result.exit_code == 0, f"Failed: {result.output}"
@@ -259,7 +264,7 @@ class TestCommaSeparatedLists:
         assert "Tags: ['cli1', 'cli2']" in result.output
         assert "Tags source: cli" in result.output
 
-    def test_comma_separated_preserves_validation(self):
+    def test_comma_separated_preserves_validation(self, runner, invoke_exit_code):
         """Test that Pydantic validation still works with comma-separated."""
 
         class Config(AutoWryModel):
@@ -281,51 +286,18 @@ class TestCommaSeparatedLists:
             click.echo(f"Tags: {config.tags}")
             return config
 
-        runner = CliRunner()
-
         # Valid: within constraints
         result = runner.invoke(cmd, ["--tags", "a,b,c"])
         assert result.exit_code == 0, f"Failed: {result.output}"
         assert "Tags: ['a', 'b', 'c']" in result.output
 
         # Invalid: empty list violates min_length=1
-        result = runner.invoke(cmd, [])
-        assert result.exit_code != 0, "Should fail validation"
+        assert invoke_exit_code(cmd, []) != 0, "Should fail validation"
 
         # Invalid: too many items (max_length=5)
-        result = runner.invoke(cmd, ["--tags", "a,b,c,d,e,f"])
-        assert result.exit_code != 0, "Should fail validation"
-
-    def test_comma_separated_empty_items_filtered(self):
-        """Test that empty items from commas are filtered out."""
-
-        class Config(AutoWryModel):
-            """Config."""
-
-            tags: Annotated[list[str], CommaSeparated] = Field(
-                default_factory=list,
-                description="Tags",
-            )
-
-        @click.command()
-        @Config.generate_click_parameters()
-        @click.pass_context
-        def cmd(ctx: click.Context, **kwargs: Any):
-            """Test command."""
-            config = Config.from_click_context(ctx, **kwargs)
-            click.echo(f"Tags: {config.tags}")
-            click.echo(f"Count: {len(config.tags)}")
-            return config
+        assert invoke_exit_code(cmd, ["--tags", "a,b,c,d,e,f"]) != 0, "Should fail validation"
 
-        runner = CliRunner()
-
-        # Multiple commas, trailing commas, etc.
-        result = runner.invoke(cmd, ["--tags", "a,,b,,,c,"])
-        assert result.exit_code == 0
-        assert "Tags: ['a', 'b', 'c']" in result.output
-        assert "Count: 3" in result.output
-
-    def test_comma_separated_help_text(self):
+    def test_comma_separated_help_text(self, runner):
         """Test that help text is appropriate for comma-separated fields."""
 
         class Config(AutoWryModel):
@@ -342,7 +314,6 @@ class TestCommaSeparatedLists:
             """Test command."""
             pass
 
-        runner = CliRunner()
         result = runner.invoke(cmd, ["--help"])
         assert result.exit_code == 0
         # Should show the option
@@ -350,7 +321,7 @@ class TestCommaSeparatedLists:
         # Should show description mentioning comma-separated
         assert "comma-separated" in result.output.lower() or "Project tags" in result.output
 
-    def test_model_wide_comma_separated_setting(self):
+    def test_model_wide_comma_separated_setting(self, runner):
         """Test comma_separated_lists class variable for model-wide setting."""
         from typing import ClassVar
 
@@ -375,8 +346,6 @@ class TestCommaSeparatedLists:
             click.echo(f"Values: {config.values}")
             return config
 
-        runner = CliRunner()
-
         # All list fields should accept comma-separated input
         result = runner.invoke(
             cmd,
@@ -394,7 +363,7 @@ class TestCommaSeparatedLists:
         assert "Ports: [8080, 8443, 9000]" in result.output
         assert "Values: [1.5, 2.7, 3.14]" in result.output
 
-    def test_per_field_annotation_overrides_model_setting(self):
+    def test_per_field_annotation_overrides_model_setting(self, runner):
         """Test that per-field CommaSeparated annotation works alongside model setting."""
         from typing import ClassVar
 
@@ -420,15 +389,13 @@ class TestCommaSeparatedLists:
             click.echo(f"Ports: {config.ports}")
             return config
 
-        runner = CliRunner()
-
         # Both should work with comma-separated
         result = runner.invoke(cmd, ["--tags", "a,b,c", "--ports", "80,443"])
         assert result.exit_code == 0, f"Failed: {result.output}"
         assert "Tags: ['a', 'b', 'c']" in result.output
         assert "Ports: [80, 443]" in result.output
 
-    def test_model_wide_setting_does_not_affect_non_list_fields(self):
+    def test_model_wide_setting_does_not_affect_non_list_fields(self, runner):
         """Test that comma_separated_lists only affects list fields, not other types."""
         from typing import ClassVar
 
@@ -470,8 +437,6 @@ class TestCommaSeparatedLists:
             click.echo(f"Verbose: {config.verbose}")
             return config
 
-        runner = CliRunner()
-
         # Test that list field uses comma-separated
         result = runner.invoke(cmd, ["--tags", "a,b,c"])
         assert result.exit_code == 0, f"Failed: {result.output}"
@@ -5,17 +5,21 @@ from typing import Annotated, Any
 
 import click
 import pytest
-from click.testing import CliRunner
 from pydantic import Field
 
 from wry import (
     AutoArgument,
+    AutoClickParameter,
     AutoExclude,
     AutoOption,
     AutoWryModel,
+    CommaSeparated,
     WryArgument,
     WryExclude,
+    WryModel,
     WryOption,
+    generate_click_parameters,
+    multi_model,
 )
 
 
@@ -108,6 +112,14 @@ class TestNewMarkerAPI:
         assert marker1.required == marker2.required
         assert marker1.flag_enable_on_off == marker2.flag_enable_on_off
 
+    def test_markers_use_slots(self):
+        """Test that markers are slotted and reject unknown attributes."""
+
+        for marker in (AutoOption(), AutoArgument(), AutoExclude()):
+            assert not hasattr(marker, "__dict__")
+            with pytest.raises(AttributeError):
+                marker.unexpected = True  # type: ignore[union-attr]
+
     def test_auto_option_with_boolean_parameters(self):
         """Test AutoOption with boolean-specific parameters."""
 
@@ -166,8 +178,6 @@ class TestNewMarkerAPI:
     def test_marker_usage_in_wry_model(self):
         """Test that new markers work with WryModel (not just AutoWryModel)."""
 
-        from wry import WryModel
-
         class Config(WryModel):
             field: Annotated[str, AutoOption()] = Field(default="value")
             arg: Annotated[str, AutoArgument()] = Field(description="Argument")
@@ -187,8 +197,6 @@ class TestNewMarkerAPI:
     def test_backward_compat_with_enum_emits_warning(self):
         """Test that old AutoClickParameter enum usage emits deprecation warning."""
 
-        from wry import AutoClickParameter
-
         with pytest.warns(DeprecationWarning, match="AutoClickParameter.*deprecated"):
 
             class Config(AutoWryModel):
@@ -203,28 +211,68 @@ class TestNewMarkerAPI:
         params = {p.name: p for p in cmd.params}
         assert "field" in params
 
-    def test_new_api_no_warnings(self):
-        """Test that new API doesn't emit any warnings."""
+    def test_enum_deprecation_warns_once_per_model(self):
+        """Test that fields sharing a deprecated marker produce a single warning."""
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("error")  # Turn warnings into errors
+        class Config(AutoWryModel):
+            first: Annotated[str, AutoClickParameter.OPTION] = Field(default="a")
+            second: Annotated[str, AutoClickParameter.OPTION] = Field(default="b")
+            third: Annotated[str, AutoClickParameter.EXCLUDE] = Field(default="c")
 
-            class Config(AutoWryModel):
-                field: Annotated[str, AutoOption()] = Field(default="value")
-                arg: Annotated[str, AutoArgument()] = Field(description="Arg")
-                hidden: Annotated[str, AutoExclude()] = Field(default="hidden")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
 
             @click.command()
             @Config.generate_click_parameters()
             def cmd(**kwargs: Any):
                 pass
 
+        messages = [str(w.message) for w in caught if issubclass(w.category, DeprecationWarning)]
+        assert len(messages) == 2
+        assert any("AutoClickParameter.OPTION" in m for m in messages)
+        assert any("AutoClickParameter.EXCLUDE" in m for m in messages)
+
+    @pytest.mark.parametrize(
+        "apply",
+        [
+            pytest.param(lambda model: generate_click_parameters(model), id="function"),
+            pytest.param(lambda model: model.generate_click_parameters(), id="classmethod"),
+            pytest.param(lambda model: multi_model(model)(lambda **kwargs: None), id="multi_model"),
+        ],
+    )
+    def test_deprecation_warning_points_at_caller(self, apply):
+        """Test that the deprecation warning names the user's file on every entry point."""
+
+        class Config(WryModel):
+            field: Annotated[str, AutoClickParameter.OPTION] = Field(default="value")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            apply(Config)
+
+        (warning,) = [w for w in caught if issubclass(w.category, DeprecationWarning)]
+        assert warning.filename == __file__
+
+    @pytest.mark.filterwarnings("error")
+    def test_new_api_no_warnings(self):
+        """Test that new API doesn't emit any warnings."""
+
+        class Config(AutoWryModel):
+            field: Annotated[str, AutoOption()] = Field(default="value")
+            arg: Annotated[str, AutoArgument()] = Field(description="Arg")
+            hidden: Annotated[str, AutoExclude()] = Field(default="hidden")
+
+        @click.command()
+        @Config.generate_click_parameters()
+        def cmd(**kwargs: Any):
+            pass
+
         # Should work without warnings
         params = {p.name: p for p in cmd.params}
         assert "field" in params
         assert "hidden" not in params
 
-    def test_comma_separated_via_auto_option(self):
+    def test_comma_separated_via_auto_option(self, runner):
         """Test comma-separated lists using AutoOption(comma_separated=True)."""
 
         class Config(AutoWryModel):
@@ -239,16 +287,13 @@ class TestNewMarkerAPI:
             config = Config.from_click_context(ctx, **kwargs)
             click.echo(f"Tags: {config.tags}")
 
-        runner = CliRunner()
-
         # Test comma-separated input
         result = runner.invoke(cmd, ["--tags", "python,rust,go"])
         assert result.exit_code == 0
         assert "Tags: ['python', 'rust', 'go']" in result.output
 
-    def test_deprecated_comma_separated_marker_warning(self):
+    def test_deprecated_comma_separated_marker_warning(self, runner):
         """Test that standalone CommaSeparated marker emits deprecation warning."""
-        from wry import CommaSeparated
 
         with pytest.warns(DeprecationWarning, match="CommaSeparated.*deprecated.*AutoOption"):
 
@@ -261,6 +306,5 @@ class TestNewMarkerAPI:
                 pass
 
         # Should still work (backwards compat)
-        runner = CliRunner()
         result = runner.invoke(cmd, ["--tags", "a,b,c"])
         assert result.exit_code == 0
@@ -3,7 +3,6 @@
 from typing import Annotated, Any, ClassVar
 
 import click
-from click.testing import CliRunner
 from pydantic import Field
 
 from wry import AutoWryModel, CommaSeparated
@@ -12,7 +11,7 @@ from wry import AutoWryModel, CommaSeparated
 class TestOptionalListCommaSeparated:
     """Test comma-separated parsing with Optional list types."""
 
-    def test_mvp_bug_optional_list_model_wide_comma_separated(self):
+    def test_mvp_bug_optional_list_model_wide_comma_separated(self, runner):
         """Test the exact MVP bug: list[str] | None with model-wide comma_separated_lists.
 
         This was the original bug report where Optional list fields with comma_separated_lists
@@ -31,8 +30,6 @@ class TestOptionalListCommaSeparated:
             click.echo(f"Raw kwargs: {kwargs}")
             click.echo(f"Parsed config: {config.items}")
 
-        runner = CliRunner()
-
         # This was the failing case - passing comma-separated values
         result = runner.invoke(cmd, ["--items", "x,y,z"])
         assert result.exit_code == 0, f"Failed: {result.output}"
@@ -43,7 +40,7 @@ class TestOptionalListCommaSeparated:
         assert result.exit_code == 0
         assert "Parsed config: None" in result.output
 
-    def test_optional_list_with_comma_separated_model_wide(self):
+    def test_optional_list_with_comma_separated_model_wide(self, runner):
         """Test that Optional[list[T]] works with model-wide comma_separated_lists."""
 
         class Config(AutoWryModel):
@@ -57,8 +54,6 @@ class TestOptionalListCommaSeparated:
             config = Config.from_click_context(ctx, **kwargs)
             click.echo(f"Items: {config.items}")
 
-        runner = CliRunner()
-
         # Test with comma-separated values
         result = runner.invoke(cmd, ["--items", "a,b,c"])
         assert result.exit_code == 0, f"Failed: {result.output}"
@@ -74,7 +69,7 @@ class TestOptionalListCommaSeparated:
         assert result.exit_code == 0
         assert "Items: None" in result.output
 
-    def test_optional_list_with_per_field_comma_separated(self):
+    def test_optional_list_with_per_field_comma_separated(self, runner):
         """Test that Optional[list[T]] works with per-field CommaSeparated annotation."""
 
         class Config(AutoWryModel):
@@ -87,8 +82,6 @@ class TestOptionalListCommaSeparated:
             config = Config.from_click_context(ctx, **kwargs)
             click.echo(f"Items: {config.items}")
 
-        runner = CliRunner()
-
         # Test with comma-separated values
         result = runner.invoke(cmd, ["--items", "x,y,z"])
         assert result.exit_code == 0
@@ -99,7 +92,7 @@ class TestOptionalListCommaSeparated:
         assert result.exit_code == 0
         assert "Items: None" in result.output
 
-    def test_optional_list_int_with_comma_separated(self):
+    def test_optional_list_int_with_comma_separated(self, runner):
         """Test that Optional[list[int]] works with comma-separated parsing."""
 
         class Config(AutoWryModel):
@@ -115,8 +108,6 @@ class TestOptionalListCommaSeparated:
             if config.ports:
                 click.echo(f"Types: {[type(p).__name__ for p in config.ports]}")
 
-        runner = CliRunner()
-
         # Test with comma-separated integers
         result = runner.invoke(cmd, ["--ports", "80,443,8080"])
         assert result.exit_code == 0
@@ -128,7 +119,7 @@ class TestOptionalListCommaSeparated:
         assert result.exit_code == 0
         assert "Ports: None" in result.output
 
-    def test_optional_list_with_default_empty_list(self):
+    def test_optional_list_with_default_empty_list(self, runner):
         """Test Optional list with default=[] instead of default=None."""
 
         class Config(AutoWryModel):
@@ -142,8 +133,6 @@ class TestOptionalListCommaSeparated:
             config = Config.from_click_context(ctx, **kwargs)
             click.echo(f"Tags: {config.tags}")
 
-        runner = CliRunner()
-
         # Test with values
         result = runner.invoke(cmd, ["--tags", "a,b"])
         assert result.exit_code == 0
@@ -154,7 +143,7 @@ class TestOptionalListCommaSeparated:
         assert result.exit_code == 0
         assert "Tags: []" in result.output
 
-    def test_optional_list_with_default_factory(self):
+    def test_optional_list_with_default_factory(self, runner):
         """Test Optional list with default_factory."""
 
         class Config(AutoWryModel):
@@ -168,8 +157,6 @@ class TestOptionalListCommaSeparated:
             config = Config.from_click_context(ctx, **kwargs)
             click.echo(f"Items: {config.items}")
 
-        runner = CliRunner()
-
         # Test with values
         result = runner.invoke(cmd, ["--items", "a,b,c"])
         assert result.exit_code == 0
@@ -180,7 +167,7 @@ class TestOptionalListCommaSeparated:
         assert result.exit_code == 0
         assert "Items: []" in result.output
 
-    def test_optional_list_old_syntax(self):
+    def test_optional_list_old_syntax(self, runner):
         """Test Optional[list[T]] using old Optional[] syntax instead of | None."""
 
         class Config(AutoWryModel):
@@ -194,8 +181,6 @@ class TestOptionalListCommaSeparated:
             config = Config.from_click_context(ctx, **kwargs)
             click.echo(f"Items: {config.items}")
 
-        runner = CliRunner()
-
         # Test with values
         result = runner.invoke(cmd, ["--items", "x,y"])
         assert result.exit_code == 0
@@ -206,7 +191,7 @@ class TestOptionalListCommaSeparated:
         assert result.exit_code == 0
         assert "Items: None" in result.output
 
-    def test_optional_list_float(self):
+    def test_optional_list_float(self, runner):
         """Test Optional[list[float]] with comma-separated parsing."""
 
         class Config(AutoWryModel):
@@ -222,8 +207,6 @@ class TestOptionalListCommaSeparated:
             if config.values:
                 click.echo(f"Types: {[type(v).__name__ for v in config.values]}")
 
-        runner = CliRunner()
-
         # Test with comma-separated floats
         result = runner.invoke(cmd, ["--values", "1.5,2.7,3.14"])
         assert result.exit_code == 0
@@ -235,7 +218,7 @@ class TestOptionalListCommaSeparated:
         assert result.exit_code == 0
         assert "Values: None" in result.output
 
-    def test_mixed_optional_and_required_lists(self):
+    def test_mixed_optional_and_required_lists(self, runner, invoke_exit_code):
         """Test model with both optional and required list fields."""
 
         class Config(AutoWryModel):
@@ -251,8 +234,6 @@ class TestOptionalListCommaSeparated:
             click.echo(f"Required: {config.required_items}")
             click.echo(f"Optional: {config.optional_items}")
 
-        runner = CliRunner()
-
         # Test with both fields
         result = runner.invoke(cmd, ["--required-items", "a,b", "--optional-items", "x,y"])
         assert result.exit_code == 0
@@ -266,10 +247,9 @@ class TestOptionalListCommaSeparated:
         assert "Optional: None" in result.output
 
         # Test missing required field should fail
-        result = runner.invoke(cmd, [])
-        assert result.exit_code != 0
+        assert invoke_exit_code(cmd, []) != 0
 
-    def test_optional_list_source_tracking(self):
+    def test_optional_list_source_tracking(self, runner):
         """Test that source tracking works correctly with optional comma-separated lists."""
 
         class Config(AutoWryModel):
@@ -284,8 +264,6 @@ class TestOptionalListCommaSeparated:
             click.echo(f"Items: {config.items}")
             click.echo(f"Source: {config.get_value_source('items').value}")
 
-        runner = CliRunner()
-
         # Test CLI source
         result = runner.invoke(cmd, ["--items", "a,b,c"])
         assert result.exit_code == 0
@@ -298,7 +276,7 @@ class TestOptionalListCommaSeparated:
         assert "Items: None" in result.output
         assert "Source: default" in result.output
 
-    def test_optional_annotated_list_non_optional(self):
+    def test_optional_annotated_list_non_optional(self, runner, invoke_exit_code):
         """Test non-optional Annotated list with CommaSeparated (for contrast)."""
 
         class Config(AutoWryModel):
@@ -311,18 +289,15 @@ class TestOptionalListCommaSeparated:
             config = Config.from_click_context(ctx, **kwargs)
             click.echo(f"Items: {config.items}")
 
-        runner = CliRunner()
-
         # Test with values
         result = runner.invoke(cmd, ["--items", "a,b,c"])
         assert result.exit_code == 0
         assert "Items: ['a', 'b', 'c']" in result.output
 
         # Test without values should fail (required)
-        result = runner.invoke(cmd, [])
-        assert result.exit_code != 0
+        assert invoke_exit_code(cmd, []) != 0
 
-    def test_optional_list_with_spaces(self):
+    def test_optional_list_with_spaces(self, runner):
         """Test comma-separated parsing handles spaces correctly."""
 
         class Config(AutoWryModel):
@@ -336,8 +311,6 @@ class TestOptionalListCommaSeparated:
             config = Config.from_click_context(ctx, **kwargs)
             click.echo(f"Items: {config.items}")
 
-        runner = CliRunner()
-
         # Test with spaces after commas (should be stripped)
         result = runner.invoke(cmd, ["--items", "a, b, c"])
         assert result.exit_code == 0
@@ -348,7 +321,7 @@ class TestOptionalListCommaSeparated:
         assert result.exit_code == 0
         assert "Items: ['item']" in result.output
 
-    def test_double_nested_optional_annotated(self):
+    def test_double_nested_optional_annotated(self, runner):
         """Test the specific pattern that was buggy.
 
         Tests: Annotated[Optional[Annotated[list, CommaSeparated]], AutoOption]
@@ -367,8 +340,6 @@ class TestOptionalListCommaSeparated:
             click.echo(f"Items: {config.items}")
             click.echo(f"Ports: {config.ports}")
 
-        runner = CliRunner()
-
         # Test both fields
         result = runner.invoke(cmd, ["--items", "a,b,c", "--ports", "80,443"])
         assert result.exit_code == 0
@@ -64,9 +64,7 @@ class TestClickParameterGeneration:
             pass
 
         # Check parameters were generated
-        assert any(p.name == "tags" for p in cmd.params)
-        assert any(p.name == "settings" for p in cmd.params)
-        assert any(p.name == "optional_value" for p in cmd.params)
+        assert {"tags", "settings", "optional_value"} <= {p.name for p in cmd.params}
 
     def test_generate_parameters_respects_field_metadata(self):
         """Test that field metadata is used in parameter generation."""
@@ -1,6 +1,5 @@
 """Test ClassVar migration from unprefixed to wry_ prefixed names."""
 
-import warnings
 from typing import Any, ClassVar
 
 import pytest
@@ -40,34 +39,30 @@ class TestClassVarMigration:
         assert hasattr(Config, "wry_comma_separated_lists")
         assert Config.wry_comma_separated_lists is True
 
+    @pytest.mark.filterwarnings("error")
     def test_new_wry_prefix_no_warning(self):
         """Test that using new wry_ prefixed names doesn't emit warnings."""
 
         # Should not emit any warnings
-        with warnings.catch_warnings():
-            warnings.simplefilter("error")  # Turn warnings into errors
-
-            class Config(WryModel):
-                wry_env_prefix: ClassVar[str] = "MYAPP_"
-                wry_comma_separated_lists: ClassVar[bool] = True
-                wry_boolean_off_prefix: ClassVar[str] = "disable"
-                name: str = Field(default="test")
+        class Config(WryModel):
+            wry_env_prefix: ClassVar[str] = "MYAPP_"
+            wry_comma_separated_lists: ClassVar[bool] = True
+            wry_boolean_off_prefix: ClassVar[str] = "disable"
+            name: str = Field(default="test")
 
         assert Config.wry_env_prefix == "MYAPP_"
         assert Config.wry_comma_separated_lists is True
         assert Config.wry_boolean_off_prefix == "disable"
 
+    @pytest.mark.filterwarnings("error")
     def test_both_old_and_new_prefix_prefers_new(self):
         """Test that when both old and new are defined, new one is used and no warning emitted."""
 
         # Should NOT emit warning when both are defined (user already migrated)
-        with warnings.catch_warnings():
-            warnings.simplefilter("error")  # Turn warnings into errors
-
-            class Config(WryModel):
-                env_prefix: ClassVar[str] = "OLD_"
-                wry_env_prefix: ClassVar[str] = "NEW_"
-                name: str = Field(default="test")
+        class Config(WryModel):
+            env_prefix: ClassVar[str] = "OLD_"
+            wry_env_prefix: ClassVar[str] = "NEW_"
+            name: str = Field(default="test")
 
         # Should use the new one (no migration happens if new exists)
         assert Config.wry_env_prefix == "NEW_"
@@ -129,6 +124,7 @@ class TestClassVarMigration:
         # Note: The child gets the base class's wry_env_prefix through normal inheritance
         assert ChildConfig.wry_env_prefix == "BASE_"
 
+    @pytest.mark.filterwarnings("error")
     def test_no_migration_when_not_in_dict(self):
         """Test that migration only happens for ClassVars defined in the class itself."""
 
@@ -137,11 +133,8 @@ class TestClassVarMigration:
             field: str = Field(default="test")
 
         # Child that inherits but doesn't redefine env_prefix shouldn't emit warning
-        with warnings.catch_warnings():
-            warnings.simplefilter("error")  # Turn warnings into errors
-
-            class ChildConfig(BaseConfig):
-                child_field: str = Field(default="child")
+        class ChildConfig(BaseConfig):
+            child_field: str = Field(default="child")
 
         # Should inherit from parent
         assert ChildConfig.wry_env_prefix == "BASE_"
@@ -76,6 +76,25 @@ class TestClickContextHandling:
         with pytest.raises(ValueError, match="Extra fields not allowed"):
             Config.from_click_context(ctx, strict=True, name="test", extra_field="not_allowed")
 
+    def test_field_lookup_is_per_class(self):
+        """Test that a subclass doesn't reuse its parent's cached field names."""
+
+        @command()
+        def cmd():
+            pass
+
+        ctx = Context(cmd)
+
+        class Parent(WryModel):
+            name: str = "default"
+
+        class Child(Parent):
+            extra: str = "child-default"
+
+        with pytest.raises(ValueError, match="Extra fields not allowed"):
+            Parent.from_click_context(ctx, strict=True, extra="x")
+        assert Child.from_click_context(ctx, strict=True, extra="x").extra == "x"
+
     def test_source_tracking_with_tracked_values(self):
         """Test that TrackedValue objects preserve their source information."""
 
@@ -15,6 +15,9 @@ from .core import WryModel
 if TYPE_CHECKING:
     pass
 
+# Marker classes, bound once rather than rebuilt for every metadata item
+_MARKER_CLASSES = (WryOption, WryArgument, WryExclude)
+
 
 class AutoWryModel(WryModel):
     """A WryModel that automatically generates Click options for all fields.
@@ -62,15 +65,15 @@ class AutoWryModel(WryModel):
             # Skip ClassVar annotations (class-level config like wry_env_prefix,
             # wry_comma_separated_lists, wry_boolean_off_prefix)
             origin = get_origin(annotation)
-            if origin is not None:
-                # ClassVar check - handle both typing.ClassVar and typing_extensions.ClassVar
-                origin_str = str(origin)
-                if "ClassVar" in origin_str:
-                    continue
+            # Rendered once and reused by both checks below
+            origin_str = str(origin) if origin is not None else ""
+            # ClassVar check - handle both typing.ClassVar and typing_extensions.ClassVar
+            if "ClassVar" in origin_str:
+                continue
 
             # Check if it's already Annotated
             # Compare using string representation to handle module reload scenarios
-            if origin is not None and str(origin) == "<class 'typing.Annotated'>":
+            if origin_str == "<class 'typing.Annotated'>":
                 # Check if it has any Click-related metadata
                 metadata = get_args(annotation)[1:]
                 has_click_metadata = any(
@@ -78,10 +81,10 @@ class AutoWryModel(WryModel):
                     isinstance(m, AutoClickParameter)
                     or
                     # Check for new Wry marker instances
-                    isinstance(m, WryOption | WryArgument | WryExclude)
+                    isinstance(m, _MARKER_CLASSES)
                     or
                     # Check for Wry marker classes (for backwards compat with old pattern)
-                    m in (WryOption, WryArgument, WryExclude)
+                    m in _MARKER_CLASSES
                     or
                     # Check for Click decorators
                     (hasattr(m, "__module__") and "click" in str(m.__module__))
@@ -110,18 +113,25 @@ class AutoWryModel(WryModel):
                 # Not annotated, add AutoOption
                 cls.__annotations__[attr_name] = Annotated[annotation, WryOption()]
 
-        # Also process fields that are defined with Field() but not in annotations
-        for attr_name in dir(cls):
-            if attr_name.startswith("_") or attr_name in cls.__annotations__:
-                continue
-
-            attr_value = getattr(cls, attr_name)
-
-            # Check if it's a field
-            if isinstance(attr_value, FieldInfo):
-                # No annotation, infer type from field
-                field_type = attr_value.annotation or Any
-                cls.__annotations__[attr_name] = Annotated[field_type, WryOption()]
+        # Also process fields that are defined with Field() but not in annotations.
+        # Read the class dicts along the MRO (nearest definition wins) rather than
+        # getattr() over every name in dir(cls) - most of those are BaseModel internals
+        annotations = cls.__annotations__
+        unannotated_fields: dict[str, FieldInfo] = {}
+        seen: set[str] = set()
+        for klass in cls.__mro__:
+            for attr_name, attr_value in vars(klass).items():
+                if attr_name in seen or attr_name.startswith("_") or attr_name in annotations:
+                    continue
+                seen.add(attr_name)
+                if isinstance(attr_value, FieldInfo):
+                    unannotated_fields[attr_name] = attr_value
+
+        # Sorted to keep the order dir() gave
+        for attr_name in sorted(unannotated_fields):
+            # No annotation, infer type from field
+            field_type = unannotated_fields[attr_name].annotation or Any
+            annotations[attr_name] = Annotated[field_type, WryOption()]
 
 
 # Convenience function for creating auto models dynamically
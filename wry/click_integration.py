@@ -9,9 +9,14 @@ Key functions:
 - build_config_with_sources: Main helper for building config with proper precedence
 """
 
+import functools
 import inspect
+import os
+import sys
 import types
+import weakref
 from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any, TypeAlias, Union, cast, get_args, get_origin, get_type_hints
 
@@ -20,9 +25,7 @@ from annotated_types import (
     Ge,
     GroupedMetadata,
     Gt,
-    Interval,
     Le,
-    Len,
     Lt,
     MaxLen,
     MinLen,
@@ -34,12 +37,16 @@ from click.decorators import FC
 from pydantic import BaseModel
 from pydantic_core import PydanticUndefined
 
+from .comma_separated import CommaSeparatedFloats, CommaSeparatedInts, CommaSeparatedStrings
 from .core import extract_field_constraints
+from .core.model import _DEFAULT_BOOLEAN_OFF_PREFIX
 
 
 class WryOption:
     """Marker for auto-generated Click options with customization."""
 
+    __slots__ = ("required", "flag_enable_on_off", "flag_off_prefix", "flag_off_option", "comma_separated")
+
     def __init__(
         self,
         *,
@@ -81,6 +88,8 @@ class WryOption:
 class WryArgument:
     """Marker for auto-generated Click arguments."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize WryArgument marker."""
         pass
@@ -89,6 +98,8 @@ class WryArgument:
 class WryExclude:
     """Marker to exclude field from CLI generation."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize WryExclude marker."""
         pass
@@ -121,12 +132,30 @@ ClickParameterDecorator: TypeAlias = Callable[[FC], FC]
 def format_constraint_text(constraints: dict[str, Any]) -> list[str]:
     """Format constraints dictionary into human-readable text.
 
+    Results are cached per distinct set of constraints, since the same few
+    bounds (``ge=0``, ``min_length=1``, ...) recur across most fields.
+
     Args:
         constraints: Dictionary of constraint names to values
 
     Returns:
         List of formatted constraint strings
     """
+    # The value type is part of the key so that e.g. ge=1 and ge=1.0 don't share an entry
+    key = tuple(sorted((name, type(value), value) for name, value in constraints.items()))
+    try:
+        return list(_format_constraint_text_cached(key))
+    except TypeError:
+        # Unhashable constraint value - format without caching
+        return list(_format_constraint_text(constraints))
+
+
+@functools.lru_cache(maxsize=512)
+def _format_constraint_text_cached(key: tuple[tuple[str, type, Any], ...]) -> tuple[str, ...]:
+    return _format_constraint_text({name: value for name, _, value in key})
+
+
+def _format_constraint_text(constraints: Mapping[str, Any]) -> tuple[str, ...]:
     texts: list[str] = []
 
     # Numeric bounds
@@ -154,119 +183,145 @@ def format_constraint_text(constraints: dict[str, Any]) -> list[str]:
     if "multiple_of" in constraints:
         texts.append(f"multiple of {constraints['multiple_of']}")
 
-    return texts
+    return tuple(texts)
 
 
+@functools.singledispatch
 def extract_constraint_text(constraint: Any) -> str | None:
     """Extract human-readable constraint text from annotated-types constraints.
 
+    Dispatches on the constraint's type; handlers for each supported
+    constraint are registered below.
+
     Args:
         constraint: An annotated-types constraint object
 
     Returns:
         Human-readable description of the constraint, or None if not recognized
     """
-    # Handle GroupedMetadata by recursively unpacking
+    # GroupedMetadata is a protocol - objects that match it without subclassing
+    # it aren't found by type dispatch
     if isinstance(constraint, GroupedMetadata):
-        sub_constraints: list[str] = []
-        for item in constraint:
-            sub_text = extract_constraint_text(item)
-            if sub_text:
-                sub_constraints.append(sub_text)
-        return " AND ".join(sub_constraints) if sub_constraints else None
+        return _grouped_constraint_text(constraint)
+    return None
 
-    # Numeric bounds
-    if isinstance(constraint, Ge):
-        return f">= {constraint.ge}"
-    elif isinstance(constraint, Gt):
-        return f"> {constraint.gt}"
-    elif isinstance(constraint, Le):
-        return f"<= {constraint.le}"
-    elif isinstance(constraint, Lt):
-        return f"< {constraint.lt}"
-
-    # Interval (combination of bounds)
-    elif isinstance(constraint, Interval):
-        parts: list[Any] = []
-        if constraint.gt is not None:
-            parts.append(f"> {constraint.gt}")
-        if constraint.ge is not None:
-            parts.append(f">= {constraint.ge}")
-        if constraint.lt is not None:
-            parts.append(f"< {constraint.lt}")
-        if constraint.le is not None:
-            parts.append(f"<= {constraint.le}")
-        return " AND ".join(parts) if parts else None
 
-    # Multiple of
-    elif isinstance(constraint, MultipleOf):
-        return f"multiple of {constraint.multiple_of}"
+# Handle GroupedMetadata (including Interval and Len) by recursively unpacking
+@extract_constraint_text.register(GroupedMetadata)
+def _grouped_constraint_text(constraint: GroupedMetadata) -> str | None:
+    sub_constraints: list[str] = []
+    for item in constraint:
+        sub_text = extract_constraint_text(item)
+        if sub_text:
+            sub_constraints.append(sub_text)
+    return " AND ".join(sub_constraints) if sub_constraints else None
 
-    # Length constraints
-    elif isinstance(constraint, Len):
-        min_len = getattr(constraint, "min_length", None)
-        max_len = getattr(constraint, "max_length", None)
-        if min_len is not None and max_len is not None:
-            if min_len == max_len:
-                return f"length = {min_len}"
-            return f"length {min_len}-{max_len}"
-        elif min_len is not None:
-            return f"length >= {min_len}"
-        elif max_len is not None:
-            return f"length <= {max_len}"
-    elif isinstance(constraint, MinLen):
-        return f"min length {constraint.min_length}"
-    elif isinstance(constraint, MaxLen):
-        return f"max length {constraint.max_length}"
-
-    # Timezone constraint
-    elif isinstance(constraint, Timezone):
-        if constraint.tz is None:
-            return "naive datetime (no timezone)"
-        elif constraint.tz == ...:
-            return "any timezone-aware datetime"
-        else:
-            return f"timezone: {constraint.tz}"
-
-    # String predicates
-    elif isinstance(constraint, Predicate):
-        return _extract_predicate_description(constraint.func)
-
-    # Handle slice objects (used for length)
-    elif isinstance(constraint, slice):
-        # Slice.start/stop are Union[int, None]
-        constraint_slice = constraint
-        start_raw = constraint_slice.start
-        stop_raw = constraint_slice.stop
-        start_val: int = int(start_raw) if start_raw is not None and isinstance(start_raw, int | float) else 0
-        stop_val: int | None = int(stop_raw) if stop_raw is not None and isinstance(stop_raw, int | float) else None
-
-        if stop_val is not None:
-            if start_val == stop_val - 1:
-                return f"length = {start_val}"
-            return f"length {start_val}-{stop_val - 1}"
-        else:
-            return f"min length {start_val}"
 
-    return None
+# Numeric bounds
+@extract_constraint_text.register(Ge)
+def _ge_text(constraint: Ge) -> str:
+    return f">= {constraint.ge}"
+
+
+@extract_constraint_text.register(Gt)
+def _gt_text(constraint: Gt) -> str:
+    return f"> {constraint.gt}"
+
+
+@extract_constraint_text.register(Le)
+def _le_text(constraint: Le) -> str:
+    return f"<= {constraint.le}"
+
+
+@extract_constraint_text.register(Lt)
+def _lt_text(constraint: Lt) -> str:
+    return f"< {constraint.lt}"
+
+
+# Multiple of
+@extract_constraint_text.register(MultipleOf)
+def _multiple_of_text(constraint: MultipleOf) -> str:
+    return f"multiple of {constraint.multiple_of}"
+
+
+# Length constraints
+@extract_constraint_text.register(MinLen)
+def _min_len_text(constraint: MinLen) -> str:
+    return f"min length {constraint.min_length}"
+
+
+@extract_constraint_text.register(MaxLen)
+def _max_len_text(constraint: MaxLen) -> str:
+    return f"max length {constraint.max_length}"
+
+
+# Timezone constraint
+@extract_constraint_text.register(Timezone)
+def _timezone_text(constraint: Timezone) -> str:
+    if constraint.tz is None:
+        return "naive datetime (no timezone)"
+    elif constraint.tz == ...:
+        return "any timezone-aware datetime"
+    else:
+        return f"timezone: {constraint.tz}"
+
+
+# String predicates
+@extract_constraint_text.register(Predicate)
+def _predicate_text(constraint: Predicate) -> str:
+    return _extract_predicate_description(constraint.func)
+
+
+# Handle slice objects (used for length)
+@extract_constraint_text.register(slice)
+def _slice_text(constraint: slice) -> str:
+    # Slice.start/stop are Union[int, None] (tuple form avoids building a union per call)
+    start = constraint.start
+    stop = constraint.stop
+    start_val: int = int(start) if isinstance(start, (int, float)) else 0
+
+    if not isinstance(stop, (int, float)):
+        return f"min length {start_val}"
+    stop_val = int(stop)
+    if stop_val - start_val == 1:
+        return f"length = {start_val}"
+    return f"length {start_val}-{stop_val - 1}"
+
+
+# Known built-in predicates (method descriptors can't be weakly referenced)
+_BUILTIN_PREDICATE_DESCRIPTIONS: dict[Callable[..., Any], str] = {
+    str.islower: "lowercase",
+    str.isupper: "uppercase",
+    str.isdigit: "digits only",
+    str.isascii: "ASCII only",
+    str.isalnum: "alphanumeric only",
+    str.isalpha: "alphabetic only",
+}
+
+# Descriptions of other predicates, computed once per function object
+_PREDICATE_DESCRIPTION_CACHE: "weakref.WeakKeyDictionary[Callable[..., Any], str]" = weakref.WeakKeyDictionary()
 
 
 def _extract_predicate_description(func: Callable[[Any], bool]) -> str:
     """Extract a meaningful description from a predicate function."""
-    # Check for known built-in predicates
-    if func == str.islower:
-        return "lowercase"
-    elif func == str.isupper:
-        return "uppercase"
-    elif func == str.isdigit:
-        return "digits only"
-    elif func == str.isascii:
-        return "ASCII only"
-    elif func == str.isalnum:
-        return "alphanumeric only"
-    elif func == str.isalpha:
-        return "alphabetic only"
+    try:
+        builtin = _BUILTIN_PREDICATE_DESCRIPTIONS.get(func)
+        if builtin is not None:
+            return builtin
+        return _PREDICATE_DESCRIPTION_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+
+    description = _describe_predicate(func)
+    try:
+        _PREDICATE_DESCRIPTION_CACHE[func] = description
+    except TypeError:
+        # Not weakly referenceable or not hashable - don't cache
+        pass
+    return description
+
 
+def _describe_predicate(func: Callable[[Any], bool]) -> str:
     # Handle named functions
     if hasattr(func, "__name__") and func.__name__ != "<lambda>":
         return f"predicate: {func.__name__}"
@@ -364,7 +419,8 @@ def config_option() -> Callable[[FC], FC]:
 
     This decorator adds a --config/-c option that loads configuration
     from a JSON file. It uses an eager callback to process the file
-    before other options are parsed.
+    before other options are parsed. Passing ``-`` reads the JSON from
+    stdin instead of a file.
 
     Returns:
         Decorator that adds the config option
@@ -372,11 +428,11 @@ def config_option() -> Callable[[FC], FC]:
     return click.option(
         "--config",
         "-c",
-        type=click.Path(exists=True, dir_okay=False, file_okay=True),
+        type=click.Path(exists=True, dir_okay=False, file_okay=True, allow_dash=True),
         callback=eager_json_config,
         is_eager=True,
         expose_value=False,
-        help="JSON configuration file",
+        help="JSON configuration file (use '-' to read from stdin)",
     )
 
 
@@ -403,9 +459,166 @@ def generate_click_parameters(
     Returns:
         Decorator function that applies all Click parameters
     """
+    field_parameters = _FIELD_PARAMETER_CACHE.get(model_class)
+    if (
+        field_parameters is None
+        or field_parameters.settings != _model_settings(model_class)
+        or any((env_var_name in os.environ) != was_set for env_var_name, was_set in field_parameters.env_checks)
+    ):
+        field_parameters = _build_field_parameters(model_class)
+    arguments = list(field_parameters.arguments)  # Arguments must come first
+    options = list(field_parameters.options)  # Options come after arguments
+    argument_docs = field_parameters.argument_docs
+
+    # We'll conditionally add these in the decorator to avoid duplicates
+    config_and_env_options: list[ClickParameterDecorator[Any]] = []
+
+    if add_config_option:
+        config_and_env_options.append(config_option())
+
+    # Add --show-env-vars option for discoverability (always)
+    def _show_env_vars(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+        """Show supported environment variables and exit."""
+        if value:
+            model_class.print_env_vars()  # type: ignore
+            ctx.exit(0)
+
+    config_and_env_options.append(
+        click.option(
+            "--show-env-vars",
+            is_flag=True,
+            help="Show supported environment variables and exit",
+            is_eager=True,
+            callback=_show_env_vars,
+            expose_value=False,
+        )
+    )
+
+    def decorator(func: FC) -> FC:
+        # Check for duplicate decorator application
+        if hasattr(func, "_wry_models"):
+            existing_models = getattr(func, "_wry_models", [])
+            model_names = [m.__name__ for m in existing_models]
+
+            if strict:
+                raise ValueError(
+                    f"Function '{func.__name__}' already decorated with "
+                    f"generate_click_parameters for models: {model_names}. "
+                    f"Use strict=False to allow multiple decorators."
+                )
+            else:
+                import warnings
+
+                warnings.warn(
+                    f"Function '{func.__name__}' already decorated with "
+                    f"generate_click_parameters for models: {model_names}. "
+                    f"Adding {model_class.__name__}. This may cause duplicate options.",
+                    UserWarning,
+                    stacklevel=2,
+                )
+
+        # Track which models have been applied
+        if not hasattr(func, "_wry_models"):
+            func._wry_models = []  # type: ignore
+        func._wry_models.append(model_class)  # type: ignore
+
+        # Check if we should skip duplicate --config and --show-env-vars options
+        if hasattr(func, "_has_config_option"):
+            # Skip adding config and env vars options as they already exist
+            final_options = options
+        else:
+            # Add config options only once
+            final_options = options + config_and_env_options
+            if config_and_env_options:
+                func._has_config_option = True  # type: ignore
+
+        # Inject argument descriptions into docstring BEFORE applying decorators
+        if argument_docs:
+            original_doc = func.__doc__ or ""
+            # Build argument documentation section
+            # Use \b to prevent Click from rewrapping, and format like Options section
+            arg_doc_lines = ["\n\n\b"]
+            arg_doc_lines.append("\n\b\bArguments:")
+            for arg_name, description in argument_docs:
+                # Match Click's Options formatting: 2 space indent, left-aligned
+                arg_doc_lines.append(f"\n\b\b  {arg_name.ljust(18)} {description}")
+            arg_doc_section = "".join(arg_doc_lines)
+
+            # Append to existing docstring
+            func.__doc__ = original_doc.rstrip() + arg_doc_section
+
+        # Apply arguments first, then options (Click requirement)
+        all_decorators = arguments + final_options
+        for dec in reversed(all_decorators):
+            func = dec(func)
+
+        return func
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class _FieldParameters:
+    """Click decorators generated from a model's fields."""
+
+    arguments: tuple[ClickParameterDecorator[Any], ...]
+    options: tuple[ClickParameterDecorator[Any], ...]
+    argument_docs: tuple[tuple[str, str], ...]  # (arg_name, description) for docstring injection
+    env_checks: tuple[tuple[str, bool], ...]  # (env var, was set) - decides Click's required flag
+    settings: tuple[Any, ...]  # _model_settings() at build time
+
+
+# Class-level settings that shape the generated options; changing one at runtime rebuilds them
+_MODEL_SETTING_NAMES = ("wry_env_prefix", "wry_comma_separated_lists", "wry_boolean_off_prefix")
+
+
+def _model_settings(model_class: type[BaseModel]) -> tuple[Any, ...]:
+    """Current values of the model's ``wry_*`` class settings."""
+    return tuple(getattr(model_class, name, None) for name in _MODEL_SETTING_NAMES)
+
+
+# Field decorators per model class. click.option/click.argument decorators build a
+# fresh Parameter each time they're applied, so they can be shared between commands.
+# An entry is rebuilt when a required field's env var appears or disappears, or when
+# one of the model's wry_* class settings changes.
+_FIELD_PARAMETER_CACHE: "weakref.WeakKeyDictionary[type[BaseModel], _FieldParameters]" = weakref.WeakKeyDictionary()
+
+# Comma-separated param types hold no state, so one instance of each serves every
+# field (as click.INT etc. do)
+_COMMA_SEPARATED_INTS = CommaSeparatedInts()
+_COMMA_SEPARATED_FLOATS = CommaSeparatedFloats()
+_COMMA_SEPARATED_STRINGS = CommaSeparatedStrings()
+
+
+# Directory of the wry package, with a trailing separator so "wry_other/" doesn't match
+_PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "")
+
+
+def _user_stacklevel() -> int:
+    """``stacklevel`` for a ``warnings.warn`` in the caller that points at the first frame outside wry.
+
+    Parameters are generated through several entry points (``generate_click_parameters``,
+    ``Model.generate_click_parameters()``, ``multi_model``), each adding its own wry frames.
+    """
+    frame = sys._getframe(1)
+    stacklevel = 1
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+        stacklevel += 1
+    return stacklevel
+
+
+def _build_field_parameters(model_class: type[BaseModel]) -> _FieldParameters:
+    """Build Click decorators for the fields of ``model_class``.
+
+    The result is cached unless building it warned or called a ``default_factory``.
+    """
     arguments: list[ClickParameterDecorator[Any]] = []  # Arguments must come first
     options: list[ClickParameterDecorator[Any]] = []  # Options come after arguments
     argument_docs: list[tuple[str, str]] = []  # Track (arg_name, description) for docstring injection
+    env_checks: list[tuple[str, bool]] = []  # (env var, was set) for each required field
+    cacheable = True
+    deprecations_warned: set[str] = set()  # Each deprecation is reported once per model, not per field
     type_hints = get_type_hints(model_class, include_extras=True)
 
     for field_name, field_info in model_class.model_fields.items():
@@ -470,14 +683,16 @@ def generate_click_parameters(
                 and hasattr(item, "__name__")
                 and item.__name__ == "CommaSeparated"
             ):
-                import warnings
-
-                warnings.warn(
+                cacheable = False
+                message = (
                     "Using standalone CommaSeparated marker is deprecated. "
-                    "Use AutoOption(comma_separated=True) instead.",
-                    DeprecationWarning,
-                    stacklevel=2,
+                    "Use AutoOption(comma_separated=True) instead."
                 )
+                if message not in deprecations_warned:
+                    deprecations_warned.add(message)
+                    import warnings
+
+                    warnings.warn(message, DeprecationWarning, stacklevel=_user_stacklevel())
                 use_comma_separated = True
                 # Don't break - continue checking for other markers
             # DEPRECATED v0.6.0: Check for Wry marker classes without calling them
@@ -499,14 +714,16 @@ def generate_click_parameters(
                 AutoClickParameter.ARGUMENT,
                 AutoClickParameter.EXCLUDE,
             ):
-                import warnings
-
-                warnings.warn(
+                cacheable = False
+                message = (
                     f"Using AutoClickParameter.{item.name} is deprecated. "
-                    f"Use Auto{item.name.title().replace('_', '')}() instead.",
-                    DeprecationWarning,
-                    stacklevel=2,
+                    f"Use Auto{item.name.title().replace('_', '')}() instead."
                 )
+                if message not in deprecations_warned:
+                    deprecations_warned.add(message)
+                    import warnings
+
+                    warnings.warn(message, DeprecationWarning, stacklevel=_user_stacklevel())
                 # Convert old enum to new marker
                 if item == AutoClickParameter.OPTION:
                     wry_marker = WryOption()
@@ -551,6 +768,8 @@ def generate_click_parameters(
             elif field_info.default_factory is not None:
                 # Field has default_factory (e.g., default_factory=list)
                 # Call it to get the default value for Click
+                # (not cached - each command gets its own default object)
+                cacheable = False
                 factory = cast(Callable[[], Any], field_info.default_factory)
                 click_kwargs["default"] = factory()
             elif not is_required:
@@ -608,19 +827,13 @@ def generate_click_parameters(
 
                 if use_comma_sep:
                     # Use comma-separated input instead of multiple=True
-                    from .comma_separated import (
-                        CommaSeparatedFloats,
-                        CommaSeparatedInts,
-                        CommaSeparatedStrings,
-                    )
-
                     # Select appropriate comma-separated type based on element type
                     if list_element_type is int:
-                        click_kwargs["type"] = CommaSeparatedInts()
+                        click_kwargs["type"] = _COMMA_SEPARATED_INTS
                     elif list_element_type is float:
-                        click_kwargs["type"] = CommaSeparatedFloats()
+                        click_kwargs["type"] = _COMMA_SEPARATED_FLOATS
                     else:  # Default to strings (includes str and other types)
-                        click_kwargs["type"] = CommaSeparatedStrings()
+                        click_kwargs["type"] = _COMMA_SEPARATED_STRINGS
                     # Don't set multiple=True for comma-separated
                 else:
                     # Standard behavior: multiple=True
@@ -651,14 +864,13 @@ def generate_click_parameters(
 
                     if not off_option_name:
                         # Use model-wide prefix (wry_boolean_off_prefix)
-                        from .core.model import _DEFAULT_BOOLEAN_OFF_PREFIX
-
                         off_prefix = getattr(model_class, "wry_boolean_off_prefix", _DEFAULT_BOOLEAN_OFF_PREFIX)
                         off_option_name = f"--{off_prefix}-{name_for_option.replace('_', '-')}"
 
                     # Collision detection
                     collision_field = off_option_name.removeprefix("--").replace("-", "_")
                     if collision_field in model_class.model_fields:
+                        cacheable = False
                         import warnings
 
                         warnings.warn(
@@ -666,7 +878,7 @@ def generate_click_parameters(
                             f"existing field '{collision_field}'. Falling back to single flag. "
                             f"Use AutoOption(flag_off_option='other-name') to customize.",
                             UserWarning,
-                            stacklevel=2,
+                            stacklevel=_user_stacklevel(),
                         )
                         click_kwargs["is_flag"] = True
                         click_kwargs.pop("show_default")
@@ -697,8 +909,6 @@ def generate_click_parameters(
 
             # Check if environment variable is set for this field
             # We need to check this to decide if Click should enforce required
-            import os
-
             # Get the environment variable prefix
             env_prefix = getattr(model_class, "wry_env_prefix", "DRYCLI_")
             # Use alias for env var name if available, otherwise use field name
@@ -711,6 +921,8 @@ def generate_click_parameters(
             # 1. Field is required in Pydantic AND
             # 2. No environment variable is set
             click_required = is_required and not env_var_set
+            if is_required:
+                env_checks.append((env_var_name, env_var_set))
 
             # Add envvar support
             option = click.option(
@@ -754,8 +966,6 @@ def generate_click_parameters(
                 click_kwargs["type"] = base_type
 
             # Check if field has a default or if env var is set
-            import os
-
             env_prefix = getattr(model_class, "wry_env_prefix", "")
             name_for_env = field_info.alias if field_info.alias else field_name
             env_var_name = f"{env_prefix}{name_for_env.upper()}"
@@ -763,6 +973,8 @@ def generate_click_parameters(
 
             # Mark as not required if field has default or env var is set
             is_required_arg = field_info.is_required() and not env_var_set
+            if field_info.is_required():
+                env_checks.append((env_var_name, env_var_set))
 
             arguments.append(click.argument(argument_name, **click_kwargs, required=is_required_arg))
 
@@ -788,91 +1000,12 @@ def generate_click_parameters(
                 if callable(click_parameter) and not isinstance(click_parameter, AutoClickParameter):
                     options.append(click_parameter)
 
-    # We'll conditionally add these in the decorator to avoid duplicates
-    config_and_env_options: list[ClickParameterDecorator[Any]] = []
-
-    if add_config_option:
-        config_and_env_options.append(config_option())
-
-    # Add --show-env-vars option for discoverability (always)
-    def _show_env_vars(ctx: click.Context, param: click.Parameter, value: bool) -> None:
-        """Show supported environment variables and exit."""
-        if value:
-            model_class.print_env_vars()  # type: ignore
-            ctx.exit(0)
-
-    config_and_env_options.append(
-        click.option(
-            "--show-env-vars",
-            is_flag=True,
-            help="Show supported environment variables and exit",
-            is_eager=True,
-            callback=_show_env_vars,
-            expose_value=False,
-        )
+    field_parameters = _FieldParameters(
+        tuple(arguments), tuple(options), tuple(argument_docs), tuple(env_checks), _model_settings(model_class)
     )
-
-    def decorator(func: FC) -> FC:
-        # Check for duplicate decorator application
-        if hasattr(func, "_wry_models"):
-            existing_models = getattr(func, "_wry_models", [])
-            model_names = [m.__name__ for m in existing_models]
-
-            if strict:
-                raise ValueError(
-                    f"Function '{func.__name__}' already decorated with "
-                    f"generate_click_parameters for models: {model_names}. "
-                    f"Use strict=False to allow multiple decorators."
-                )
-            else:
-                import warnings
-
-                warnings.warn(
-                    f"Function '{func.__name__}' already decorated with "
-                    f"generate_click_parameters for models: {model_names}. "
-                    f"Adding {model_class.__name__}. This may cause duplicate options.",
-                    UserWarning,
-                    stacklevel=2,
-                )
-
-        # Track which models have been applied
-        if not hasattr(func, "_wry_models"):
-            func._wry_models = []  # type: ignore
-        func._wry_models.append(model_class)  # type: ignore
-
-        # Check if we should skip duplicate --config and --show-env-vars options
-        if hasattr(func, "_has_config_option"):
-            # Skip adding config and env vars options as they already exist
-            final_options = options
-        else:
-            # Add config options only once
-            final_options = options + config_and_env_options
-            if config_and_env_options:
-                func._has_config_option = True  # type: ignore
-
-        # Inject argument descriptions into docstring BEFORE applying decorators
-        if argument_docs:
-            original_doc = func.__doc__ or ""
-            # Build argument documentation section
-            # Use \b to prevent Click from rewrapping, and format like Options section
-            arg_doc_lines = ["\n\n\b"]
-            arg_doc_lines.append("\n\b\bArguments:")
-            for arg_name, description in argument_docs:
-                # Match Click's Options formatting: 2 space indent, left-aligned
-                arg_doc_lines.append(f"\n\b\b  {arg_name.ljust(18)} {description}")
-            arg_doc_section = "".join(arg_doc_lines)
-
-            # Append to existing docstring
-            func.__doc__ = original_doc.rstrip() + arg_doc_section
-
-        # Apply arguments first, then options (Click requirement)
-        all_decorators = arguments + final_options
-        for dec in reversed(all_decorators):
-            func = dec(func)
-
-        return func
-
-    return decorator
+    if cacheable:
+        _FIELD_PARAMETER_CACHE[model_class] = field_parameters
+    return field_parameters
 
 
 def extract_and_modify_argument_decorator(
@@ -885,7 +1018,15 @@ def extract_and_modify_argument_decorator(
             - param_decls: list of parameter declaration strings
             - help: help text if available
             - other attributes from the original decorator
+
+    The result is stored on the original decorator, so a decorator shared by
+    several models is only inspected once.
     """
+    cached = getattr(click_decorator, "_wry_extracted_argument", None)
+    if cached is not None:
+        modified, cached_info = cached
+        return modified, dict(cached_info)
+
     # Default values - use a safe fallback
     param_decls: list[str] = ["argument"]
     attrs: dict[str, Any] = {}  # Don't override required - let Click handle it
@@ -934,7 +1075,13 @@ def extract_and_modify_argument_decorator(
     argument_attrs = {k: v for k, v in attrs.items() if k != "help"}
 
     # Create new argument with modified attrs
-    return click.argument(*param_decls, **argument_attrs), info
+    modified = click.argument(*param_decls, **argument_attrs)
+    try:
+        click_decorator._wry_extracted_argument = (modified, info)  # type: ignore[attr-defined]
+    except (AttributeError, TypeError):
+        # Objects that don't accept attributes are just inspected again next time
+        pass
+    return modified, dict(info)
 
 
 def build_config_with_sources(
@@ -986,10 +1133,9 @@ def build_config_with_sources(
         # No valid config class provided
         raise ValueError("config_class must be provided")
 
-    # Check if the config class has the new method
-    if hasattr(actual_config_class, "from_click_context"):
-        # Use getattr to satisfy type checker
-        from_click_context = actual_config_class.from_click_context
+    # Check if the config class has the new method (one lookup, reused for the call)
+    from_click_context = getattr(actual_config_class, "from_click_context", None)
+    if from_click_context is not None:
         return from_click_context(actual_ctx, **kwargs)
     else:
         # Fallback for regular Pydantic models without WryModel
@@ -1009,7 +1155,7 @@ def eager_json_config(ctx: click.Context, param: click.Parameter, value: Any) ->
     Args:
         ctx: Click context
         param: Click parameter (the config file option)
-        value: Path to JSON config file
+        value: Path to JSON config file, or ``-`` to read JSON from stdin
 
     Returns:
         The original value (config file path)
@@ -1023,8 +1169,11 @@ def eager_json_config(ctx: click.Context, param: click.Parameter, value: Any) ->
         return value
 
     try:
-        with open(value) as f:
-            json_data = json.load(f)
+        if value == "-":
+            json_data = json.load(sys.stdin)
+        else:
+            with open(value) as f:
+                json_data = json.load(f)
 
         # Store JSON data for later merging in from_click_context
         ctx.ensure_object(dict)["json_data"] = json_data
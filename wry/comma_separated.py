@@ -49,6 +49,12 @@ from typing import Any
 import click
 
 
+def _split_items(value: Any) -> list[str]:
+    """Split ``value`` on commas, stripping each item and dropping empty ones."""
+    # One strip per item, and filter/map stay in C
+    return list(filter(None, map(str.strip, str(value).split(","))))
+
+
 class CommaSeparatedStrings(click.ParamType):
     """Click parameter type for comma-separated string lists.
 
@@ -82,7 +88,7 @@ class CommaSeparatedStrings(click.ParamType):
 
         # Parse comma-separated string
         try:
-            return [item.strip() for item in str(value).split(",") if item.strip()]
+            return _split_items(value)
         except Exception as e:
             self.fail(f"{value!r} is not a valid comma-separated list: {e}", param, ctx)
 
@@ -119,8 +125,7 @@ class CommaSeparatedInts(click.ParamType):
 
         # Parse comma-separated string
         try:
-            items = [item.strip() for item in str(value).split(",") if item.strip()]
-            return [int(item) for item in items]
+            return list(map(int, _split_items(value)))
         except ValueError as e:
             self.fail(f"{value!r} contains invalid integer: {e}", param, ctx)
         except Exception as e:
@@ -159,8 +164,7 @@ class CommaSeparatedFloats(click.ParamType):
 
         # Parse comma-separated string
         try:
-            items = [item.strip() for item in str(value).split(",") if item.strip()]
-            return [float(item) for item in items]
+            return list(map(float, _split_items(value)))
         except ValueError as e:
             self.fail(f"{value!r} contains invalid float: {e}", param, ctx)
         except Exception as e:
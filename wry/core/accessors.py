@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 class SourceAccessor:
     """Accessor for field source information."""
 
+    __slots__ = ("_config",)
+
     def __init__(self, config_instance: "WryModel") -> None:
         self._config = config_instance
 
@@ -32,6 +34,8 @@ class MinimumAccessor:
         >>> config.minimum.score  # Returns minimum score constraint
     """
 
+    __slots__ = ("_config",)
+
     def __init__(self, config_instance: "WryModel") -> None:
         self._config = config_instance
 
@@ -52,6 +56,8 @@ class MaximumAccessor:
         >>> config.maximum.score  # Returns maximum score constraint
     """
 
+    __slots__ = ("_config",)
+
     def __init__(self, config_instance: "WryModel") -> None:
         self._config = config_instance
 
@@ -72,6 +78,8 @@ class ConstraintsAccessor:
         >>> config.constraints.name  # Returns all name constraints
     """
 
+    __slots__ = ("_config",)
+
     def __init__(self, config_instance: "WryModel") -> None:
         self._config = config_instance
 
@@ -92,6 +100,8 @@ class DefaultsAccessor:
         >>> config.defaults.retries  # Returns default retries value
     """
 
+    __slots__ = ("_config",)
+
     def __init__(self, config_instance: "WryModel") -> None:
         self._config = config_instance
 
@@ -1,6 +1,6 @@
 """Core WryModel implementation."""
 
-import json
+import weakref
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
@@ -29,6 +29,25 @@ T = TypeVar("T", bound="WryModel")
 # Module-level constant for default boolean off-prefix
 _DEFAULT_BOOLEAN_OFF_PREFIX: str = "no"
 
+# Per-class key -> field name, where a key is a field name or an alias, used by
+# from_click_context. Fields are fixed once a model class is defined, so this is computed once.
+_FIELD_LOOKUP_CACHE: "weakref.WeakKeyDictionary[type[BaseModel], dict[str, str]]" = weakref.WeakKeyDictionary()
+
+
+def _field_lookup(model_class: type[BaseModel]) -> dict[str, str]:
+    """Map each field name and alias of the model to its field name."""
+    lookup = _FIELD_LOOKUP_CACHE.get(model_class)
+    if lookup is None:
+        lookup = {
+            field_info.alias: field_name
+            for field_name, field_info in model_class.model_fields.items()
+            if field_info.alias
+        }
+        # A field name wins over another field's alias
+        lookup.update((field_name, field_name) for field_name in model_class.model_fields)
+        _FIELD_LOOKUP_CACHE[model_class] = lookup
+    return lookup
+
 
 class WryModel(BaseModel):
     """Pydantic model with value source tracking.
@@ -374,6 +393,8 @@ class WryModel(BaseModel):
             json.JSONDecodeError: If file is not valid JSON
             ValidationError: If data doesn't match model schema
         """
+        import json
+
         if not file_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
@@ -395,6 +416,8 @@ class WryModel(BaseModel):
         Args:
             file_path: Path to save JSON file
         """
+        import json
+
         file_path.parent.mkdir(parents=True, exist_ok=True)
         with open(file_path, "w") as f:
             json.dump(self.model_dump(), f, indent=2)
@@ -515,42 +538,21 @@ class WryModel(BaseModel):
             # Default to model's extra config
             strict = cls.model_config.get("extra", "ignore") == "forbid"
 
+        # Field names and aliases mapped to field names, for handling Pydantic aliases (cached per class)
+        key_to_field = _field_lookup(cls)
+
         if strict:
-            # Build alias set for validation
-            valid_aliases = {field_info.alias for field_info in cls.model_fields.values() if field_info.alias}
             # Check for extra fields (allow both field names and aliases)
-            valid_keys = set(cls.model_fields.keys()) | valid_aliases
-            extra_fields = set(kwargs.keys()) - valid_keys
+            extra_fields = {k for k in kwargs if k not in key_to_field}
             if extra_fields:
                 raise ValueError(f"Extra fields not allowed: {extra_fields}")
 
-        # Build alias-to-field mapping for handling Pydantic aliases
-        alias_to_field: dict[str, str] = {}
-        for field_name, field_info in cls.model_fields.items():
-            if field_info.alias:
-                alias_to_field[field_info.alias] = field_name
-
-        # Filter kwargs to include both field names AND aliases
-        model_fields = set(cls.model_fields.keys())
-        filtered_kwargs: dict[str, Any] = {}
-
-        for k, v in kwargs.items():
-            if k in model_fields:
-                # Direct field name match
-                filtered_kwargs[k] = v
-            elif k in alias_to_field:
-                # Alias match - map to field name
-                field_name = alias_to_field[k]
-                filtered_kwargs[field_name] = v
+        # Filter kwargs to include both field names AND aliases, mapped to field names
+        filtered_kwargs: dict[str, Any] = {key_to_field[k]: v for k, v in kwargs.items() if k in key_to_field}
 
         # If kwargs are empty but ctx.params has values, use those (for test compatibility)
         if not filtered_kwargs and hasattr(ctx, "params") and ctx.params:
-            for k, v in ctx.params.items():
-                if k in model_fields:
-                    filtered_kwargs[k] = v
-                elif k in alias_to_field:
-                    field_name = alias_to_field[k]
-                    filtered_kwargs[field_name] = v
+            filtered_kwargs = {key_to_field[k]: v for k, v in ctx.params.items() if k in key_to_field}
 
         # Get JSON data from context if available
         json_data = ctx.obj.get("json_data", {}) if ctx.obj else {}
@@ -575,19 +577,14 @@ class WryModel(BaseModel):
 
         # 3. Override with JSON values (handle both field names and aliases)
         for key, value in json_data.items():
-            if key in cls.model_fields:
-                # Direct field name match
-                config_data[key] = TrackedValue(value, ValueSource.JSON)
-            elif key in alias_to_field:
-                # Alias match - map to field name
-                field_name = alias_to_field[key]
-                config_data[field_name] = TrackedValue(value, ValueSource.JSON)
+            if key in key_to_field:
+                config_data[key_to_field[key]] = TrackedValue(value, ValueSource.JSON)
 
         # 4. Override with CLI values from kwargs (but respect Click's source info)
-        for field_name in cls.model_fields:
+        ctx_params = getattr(ctx, "params", None) or {}
+        for field_name, field_info in cls.model_fields.items():
             if field_name in filtered_kwargs:
                 value = filtered_kwargs[field_name]
-                field_info = cls.model_fields[field_name]
 
                 # Check Click's parameter source if available
                 # Try both alias and field name since Click might know it by either
@@ -616,9 +613,9 @@ class WryModel(BaseModel):
                 if field_name not in config_data or config_data[field_name].value != value:
                     config_data[field_name] = TrackedValue(value, ValueSource.CLI)
 
-            elif hasattr(ctx, "params") and field_name in ctx.params:
+            elif field_name in ctx_params:
                 # Handle values that are in ctx.params but not in kwargs (test scenarios)
-                value = ctx.params[field_name]
+                value = ctx_params[field_name]
                 if field_name not in config_data or config_data[field_name].value != value:
                     config_data[field_name] = TrackedValue(value, ValueSource.CLI)
 
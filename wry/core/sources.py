@@ -14,7 +14,7 @@ class ValueSource(Enum):
     JSON = "json"
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackedValue:
     """An argument value with its source."""
 
@@ -28,7 +28,7 @@ class TrackedValue:
         return f"TrackedValue({self.value!r}, {self.source.value})"
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldWithSource:
     """Field value with its source information."""
 